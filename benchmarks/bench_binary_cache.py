@@ -0,0 +1,57 @@
+# =============================================================================
+# CSV vs Parquet vs Arrow(메모리 매핑) 로드 속도 비교
+# 실행: python -m benchmarks.bench_binary_cache [--rows 500000] [--data-dir data]
+# =============================================================================
+
+import argparse
+import shutil
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.common import best_ms, make_cluster_csv
+from utils.data_loader import (
+    CLUSTER_READ_OPTIONS, STORE_SUFFIX, cache_path_for, read_store, read_table,
+    store_to_frame, write_binary_cache, write_cluster_store,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--data-dir', type=Path, default=None,
+                        help="실제 data 폴더의 ive_cluster_*.csv로 측정 (없으면 임시 데이터 생성)")
+    args = parser.parse_args()
+
+    tmp_dir = None
+    if args.data_dir is None:
+        tmp_dir = Path(tempfile.mkdtemp())
+        csv_paths = [tmp_dir / 'ive_cluster_0.csv']
+        make_cluster_csv(csv_paths[0], args.rows)
+    else:
+        csv_paths = sorted(args.data_dir.glob('ive_cluster_*.csv'))
+
+    try:
+        print(f"{'file':<24}{'csv(ms)':>10}{'parquet(ms)':>13}{'arrow(ms)':>11}"
+              f"{'parquet x':>11}{'arrow x':>9}{'size':>14}")
+        for csv_path in csv_paths:
+            write_binary_cache(csv_path, CLUSTER_READ_OPTIONS)
+            write_cluster_store(csv_path)
+            cache_path = cache_path_for(csv_path)
+            store_path = cache_path_for(csv_path, STORE_SUFFIX)
+
+            t_csv = best_ms(lambda: pd.read_csv(csv_path, **CLUSTER_READ_OPTIONS), args.repeat)
+            t_bin = best_ms(lambda: read_table(csv_path, CLUSTER_READ_OPTIONS), args.repeat)
+            t_map = best_ms(lambda: store_to_frame(read_store(store_path)), args.repeat)
+            size = f"{csv_path.stat().st_size // 1024}K→{cache_path.stat().st_size // 1024}K"
+            print(f"{csv_path.name:<24}{t_csv:>10.1f}{t_bin:>13.1f}{t_map:>11.1f}"
+                  f"{t_csv / t_bin:>10.1f}x{t_csv / t_map:>8.1f}x{size:>14}")
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main()
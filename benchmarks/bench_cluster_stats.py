@@ -0,0 +1,50 @@
+# =============================================================================
+# home.py 통계 계산 마이크로 벤치마크
+#  - 이전: rerun마다 평균 3번 + describe() + select_dtypes().corr()
+#  - 이후: ClusterStats 한 번 계산 (캐시 적중 시 rerun 비용은 0에 가까움)
+# 실행: python -m benchmarks.bench_cluster_stats [--sizes 100000 1000000]
+# =============================================================================
+
+import argparse
+
+import numpy as np
+
+from benchmarks.common import best_ms, make_cluster_df
+from utils.stats import ClusterStats
+
+
+def make_numeric_df(rows, seed=0):
+    """home.py가 받는 숫자 컬럼만 남긴 클러스터 데이터 (Cluster 컬럼 포함)"""
+    df = make_cluster_df(rows, seed).select_dtypes(include=[np.number])
+    df['Cluster'] = np.zeros(rows, dtype=np.int64)
+    return df
+
+
+def stats_before(df):
+    means = [df['CPA'].mean(), df['CVR'].mean(), df['rpt_time_turn'].mean()]
+    describe = df.describe()
+    corr = df[df.select_dtypes(include=[np.number]).columns].corr()
+    return means, describe, corr
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12}{'before(ms)':>12}{'after(ms)':>12}{'speedup':>9}")
+    for rows in args.sizes:
+        df = make_numeric_df(rows)
+        _, describe, corr = stats_before(df)
+        stats = ClusterStats(df)
+        assert np.allclose(describe.to_numpy(), stats.describe.to_numpy(), equal_nan=True)
+        assert np.allclose(corr.to_numpy(), stats.corr.to_numpy(), equal_nan=True)
+
+        t_before = best_ms(lambda: stats_before(df), args.repeat)
+        t_after = best_ms(lambda: ClusterStats(df), args.repeat)
+        print(f"{rows:>12,}{t_before:>12.1f}{t_after:>12.1f}{t_before / t_after:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# =============================================================================
+# 클러스터 전환 시 메모리(RSS) 증가량 비교: CSV 전체 로드 vs 메모리 매핑 컬럼 뷰
+# 실행: python -m benchmarks.bench_cluster_store [--clusters 20] [--rows 200000]
+# (Linux 전용: /proc/self/status의 RssAnon / RssFile 사용)
+# =============================================================================
+
+import argparse
+import gc
+import shutil
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.common import make_cluster_csv
+from utils.data_loader import (
+    CLUSTER_READ_OPTIONS, STORE_SUFFIX, cache_path_for, read_store,
+    store_to_frame, write_cluster_store,
+)
+
+TOP3_COLUMNS = ('ads_shape', 'mda_idx', 'ads_time')
+
+
+def rss_kb():
+    """(익명 메모리, 파일 매핑 메모리) KB"""
+    values = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if key in ('RssAnon', 'RssFile'):
+                values[key] = int(rest.split()[0])
+    return values['RssAnon'], values['RssFile']
+
+
+def measure(label, load, csv_paths):
+    """모든 클러스터를 한 번씩 열어 둔 상태(캐시처럼)의 메모리 증가량 출력"""
+    gc.collect()
+    anon_before, file_before = rss_kb()
+    frames = []
+    for csv_path in csv_paths:
+        df = load(csv_path)
+        df['CPA'].mean()
+        df[list(TOP3_COLUMNS)].drop_duplicates()
+        frames.append(df)
+    gc.collect()
+    anon_after, file_after = rss_kb()
+    print(f"{label:<12}{(anon_after - anon_before) / 1024:>14.1f}{(file_after - file_before) / 1024:>14.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clusters', type=int, default=20)
+    parser.add_argument('--rows', type=int, default=200_000)
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp())
+    try:
+        csv_paths = []
+        for n in range(args.clusters):
+            csv_path = tmp_dir / f'ive_cluster_{n}.csv'
+            make_cluster_csv(csv_path, args.rows, seed=n)
+            write_cluster_store(csv_path)
+            csv_paths.append(csv_path)
+
+        print(f"{'loader':<12}{'anon(MB)':>14}{'file(MB)':>14}")
+        measure('arrow-mmap', lambda p: store_to_frame(
+            read_store(cache_path_for(p, STORE_SUFFIX)), TOP3_COLUMNS + ('CPA',)), csv_paths)
+        measure('csv', lambda p: pd.read_csv(p, **CLUSTER_READ_OPTIONS), csv_paths)
+        print("anon: 프로세스 전용 메모리 / file: 프로세스 간 공유 가능한 페이지 캐시")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# =============================================================================
+# 조합별 고유값 + 개수 집계 마이크로 벤치마크
+#  - 이전: drop_duplicates → groupby().size() → mda_idx 문자열 변환 2번 → merge
+#  - 이후: groupby(sort=False).size() 한 번 (고유 조합과 개수를 같이 얻음)
+# 실행: python -m benchmarks.bench_condition_counts [--sizes 10000 100000 1000000]
+# =============================================================================
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_ms, make_cluster_df
+from utils.recommend import FEATURE_COLUMNS
+
+FEATURES = list(FEATURE_COLUMNS)
+
+
+def counts_before(df):
+    unique_conditions = df[FEATURES].drop_duplicates()
+    result_df = unique_conditions.copy()
+    result_df['mda_idx'] = result_df['mda_idx'].astype(str)
+    count_df = df.groupby(FEATURES).size().reset_index(name='Data_Count')
+    count_df['mda_idx'] = count_df['mda_idx'].astype(str)
+    result_df = pd.merge(result_df, count_df, on=FEATURES, how='left')
+    result_df['Data_Count'] = result_df['Data_Count'].fillna(0)
+    return result_df
+
+
+def counts_after(df):
+    counts = df.groupby(FEATURES, sort=False).size()
+    result_df = counts.index.to_frame(index=False)
+    result_df['Data_Count'] = counts.to_numpy()
+    return result_df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000, 5_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12}{'conditions':>12}{'before(ms)':>12}{'after(ms)':>12}{'speedup':>9}")
+    for rows in args.sizes:
+        df = make_cluster_df(rows)[FEATURES]
+        before, after = counts_before(df), counts_after(df)
+        assert np.array_equal(before['Data_Count'].to_numpy(), after['Data_Count'].to_numpy())
+
+        t_before = best_ms(lambda: counts_before(df), args.repeat)
+        t_after = best_ms(lambda: counts_after(df), args.repeat)
+        print(f"{rows:>12,}{len(after):>12,}{t_before:>12.1f}{t_after:>12.1f}{t_before / t_after:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
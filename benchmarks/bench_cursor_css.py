@@ -0,0 +1,33 @@
+# =============================================================================
+# 커서 CSS 생성 rerun당 지연시간 비교
+#  - 이전: 매 rerun마다 열기 → RGBA 변환 → LANCZOS 리사이즈 → PNG 인코딩 → Base64
+#  - 이후: stat 한 번 + 캐시 조회
+# 실행: python -m benchmarks.bench_cursor_css [--repeat 50]
+# =============================================================================
+
+import argparse
+
+from benchmarks.common import percentile_ms
+from utils.assets import cursor_css, find_image, get_resized_png_b64
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--width', type=int, default=90)
+    args = parser.parse_args()
+
+    cursor_path = find_image("찐막.png")
+    cursor_css(cursor_path, args.width)   # 캐시 채우기
+
+    before = percentile_ms(lambda: get_resized_png_b64(cursor_path, args.width), args.repeat)
+    after = percentile_ms(lambda: cursor_css(cursor_path, args.width), args.repeat)
+
+    print(f"{'per rerun':<24}{'p50(ms)':>10}{'p95(ms)':>10}")
+    print(f"{'resize+encode [before]':<24}{before[0]:>10.3f}{before[1]:>10.3f}")
+    print(f"{'cached css':<24}{after[0]:>10.3f}{after[1]:>10.3f}")
+    print(f"speedup(p50): {before[0] / after[0]:,.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# =============================================================================
+# TOP_3.py 콜드 스타트 import 비용 (python -X importtime)
+#  - 이전: matplotlib.pyplot / seaborn / platform / itertools / pandas / numpy를
+#          쓰지 않으면서 import, 추천 모듈이 RobustScaler 때문에 sklearn import
+#  - 이후: 페이지가 실제로 쓰는 모듈만 import, 스케일링은 NumPy 중앙값/IQR
+# 실행: python -m benchmarks.bench_import_time [--repeat 5]
+# =============================================================================
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+
+from utils.data_loader import SCRIPT_DIR
+
+PAGE_PATH = SCRIPT_DIR / 'pages' / 'TOP_3.py'
+
+BEFORE_IMPORTS = """
+import streamlit as st
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+import platform
+import os
+import itertools
+import altair as alt
+from sklearn.preprocessing import RobustScaler
+"""
+
+
+def page_imports(path=PAGE_PATH):
+    """페이지 파일 맨 위의 import 문만 뽑아서 그대로 반환"""
+    source = path.read_text(encoding='utf-8')
+    lines = [ast.get_source_segment(source, node)
+             for node in ast.parse(source).body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return '\n'.join(lines)
+
+
+def import_time(code):
+    """새 인터프리터에서 code를 실행하고 (최상위 모듈별 누적 import 시간(us) 딕셔너리, 합계) 반환"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=SCRIPT_DIR, capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        # 들여쓰기 없는 이름 = 이 코드가 직접 일으킨 최상위 import
+        if not line.rsplit('|', 1)[1].startswith('  '):
+            modules[name] = int(cumulative)
+    return modules, sum(modules.values())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8)
+    args = parser.parse_args()
+
+    after_imports = page_imports()
+    for label, code in (('before', BEFORE_IMPORTS), ('after', after_imports)):
+        runs = [import_time(code) for _ in range(args.repeat)]
+        totals = [total for _, total in runs]
+        modules, _ = min(runs, key=lambda run: run[1])
+        print(f"[{label}] 중앙값 {statistics.median(totals) / 1000:.0f}ms "
+              f"(최소 {min(totals) / 1000:.0f}ms, 최상위 모듈 {len(modules)}개)")
+        for name, cumulative in sorted(modules.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {name:<40}{cumulative / 1000:>8.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+# =============================================================================
+# 다중 세션 부하 테스트 (streamlit.testing.v1.AppTest, 브라우저/서버 없이 실행)
+#  - cold: 새 프로세스에서 페이지 첫 실행 (캐시 비어 있음, 모듈 import 포함)
+#  - warm: 같은 페이지/조합을 새 세션으로 다시 실행
+#  - load: 메인 스크립트 세션 여러 개가 사이드바 조합과 페이지를 돌아가며 rerun
+# 실행: python -m benchmarks.bench_load_test [--sessions 8 --reruns 20 --processes 1]
+#       [--data-root /tmp/scale_10x]  (tools.generate_synthetic_data로 만든 데이터로 규모 테스트)
+#       예산(benchmarks/load_budget.json)을 넘는 항목이 있으면 종료 코드 1
+# =============================================================================
+
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+from utils.data_loader import DATA_ROOT_ENV, SCRIPT_DIR
+
+BUDGET_PATH = Path(__file__).with_name('load_budget.json')
+PAGES = ('pages/home.py', 'pages/TOP_3.py')
+
+# 사이드바 selectbox 값 (메인 스크립트 7번 섹션과 같은 목록)
+INDUSTRIES = ["음식", "쇼핑/커머스", "게임", "금융/보험", "건강/운동", "생활/유틸리티", "엔터테인먼트", "법", "교육/학습"]
+OS_TYPES = ["Web", "Android", "iOS"]
+MONTHS = ["1Q", "2Q", "3Q", "4Q"]
+
+
+# =============================================================================
+# 1. 세션 시뮬레이션
+# =============================================================================
+def use_navigation_pages():
+    """AppTest에서도 실제 서버처럼 st.navigation 경로로 페이지 전환
+
+    AppTest는 실행할 때마다 PagesManager.uses_pages_directory를 초기화하는데, 저장소에
+    pages/ 폴더가 있으면 switch_page 후 메인 스크립트 없이 페이지 파일만 실행합니다
+    (사이드바/테마가 빠짐). 실제 서버에서는 첫 실행의 st.navigation이 이 값을 False로
+    고정하므로, 생성 직후 False로 맞춰 같은 동작을 재현합니다.
+    """
+    import streamlit.testing.v1.app_test as app_test_module
+    from streamlit.runtime.pages_manager import PagesManager
+
+    class NavigationPagesManager(PagesManager):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            PagesManager.uses_pages_directory = False
+
+    app_test_module.PagesManager = NavigationPagesManager
+
+
+def entry_script():
+    """메인 스트림릿 스크립트 경로 (파일명이 한글이라 디렉터리에서 찾음)"""
+    return next(path for path in SCRIPT_DIR.glob('*.py'))
+
+
+def combo(step):
+    """step번째 (산업군, OS, 분기) 조합 (혼합 진법으로 풀어서 9*3*4개 조합을 모두 한 번씩 방문)"""
+    step %= len(INDUSTRIES) * len(OS_TYPES) * len(MONTHS)
+    step, month = divmod(step, len(MONTHS))
+    industry, os_type = divmod(step, len(OS_TYPES))
+    return INDUSTRIES[industry], OS_TYPES[os_type], MONTHS[month]
+
+
+def timed_run(app):
+    """rerun 한 번의 소요 시간(ms)과 예외 여부"""
+    start = time.perf_counter()
+    app.run()
+    return (time.perf_counter() - start) * 1000, len(app.exception) > 0
+
+
+def page_once(page, timeout):
+    """페이지 하나를 새 세션으로 한 번 실행"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(SCRIPT_DIR / page), default_timeout=timeout)
+    industry, os_type, month = combo(0)
+    app.session_state['selected_industry'] = industry
+    app.session_state['selected_os'] = os_type
+    app.session_state['selected_month'] = month
+    return timed_run(app)
+
+
+def run_worker(worker_id, sessions, reruns, timeout):
+    """한 프로세스(= 서버 하나) 안에서 cold/warm 측정 후 세션 여러 개를 번갈아 rerun"""
+    from streamlit.testing.v1 import AppTest
+
+    use_navigation_pages()
+    result = {'cold': {}, 'warm': {}, 'latencies': [], 'errors': 0}
+    for phase in ('cold', 'warm'):
+        for page in PAGES:
+            elapsed, failed = page_once(page, timeout)
+            result[phase][page] = elapsed
+            result['errors'] += failed
+
+    # 세션마다 첫 실행 (캐시는 프로세스 공용, session_state는 세션별)
+    apps = []
+    for _ in range(sessions):
+        app = AppTest.from_file(str(entry_script()), default_timeout=timeout)
+        _, failed = timed_run(app)
+        result['errors'] += failed
+        apps.append(app)
+
+    # 라운드 로빈으로 rerun: 조합을 바꾸고 두 페이지를 번갈아 이동
+    for step in range(reruns):
+        for session_id, app in enumerate(apps):
+            industry, os_type, month = combo(worker_id * sessions + session_id + step + 1)
+            app.selectbox(key='selected_industry').set_value(industry)
+            app.selectbox(key='selected_os').set_value(os_type)
+            app.selectbox(key='selected_month').set_value(month)
+            app.switch_page(PAGES[(session_id + step) % len(PAGES)])
+            elapsed, failed = timed_run(app)
+            result['latencies'].append(elapsed)
+            result['errors'] += failed
+
+    # Linux의 ru_maxrss 단위는 KB
+    result['peak_rss_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return result
+
+
+# =============================================================================
+# 2. 집계 및 예산 비교
+# =============================================================================
+def summarize(results):
+    """워커 결과를 합쳐 예산 파일과 같은 키의 지표 딕셔너리로 정리"""
+    latencies = np.concatenate([r['latencies'] for r in results])
+    cold = [ms for r in results for ms in r['cold'].values()]
+    warm = [ms for r in results for ms in r['warm'].values()]
+    return {
+        'rerun_p50_ms': float(np.percentile(latencies, 50)),
+        'rerun_p95_ms': float(np.percentile(latencies, 95)),
+        'rerun_p99_ms': float(np.percentile(latencies, 99)),
+        'cold_ms': max(cold),
+        'warm_ms': max(warm),
+        'peak_rss_mb': max(r['peak_rss_mb'] for r in results),
+        'errors': sum(r['errors'] for r in results),
+    }
+
+
+def check_budget(metrics, budget):
+    """예산을 넘은 항목 이름 목록 (예산 파일에 없는 항목은 검사하지 않음)"""
+    return [name for name, limit in budget.items() if name in metrics and metrics[name] > limit]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sessions', type=int, default=8, help='프로세스당 동시 세션 수')
+    parser.add_argument('--reruns', type=int, default=20, help='세션당 rerun 횟수')
+    parser.add_argument('--processes', type=int, default=1, help='병렬 워커 프로세스 수 (서버 여러 대)')
+    parser.add_argument('--timeout', type=float, default=60, help='rerun 한 번의 제한 시간(초)')
+    parser.add_argument('--budget', type=Path, default=BUDGET_PATH)
+    parser.add_argument('--no-budget', action='store_true', help='예산 검사 없이 결과만 출력')
+    parser.add_argument('--json', type=Path, help='지표를 JSON 파일로도 저장')
+    parser.add_argument('--data-root', type=Path, help=f'data/, model/ 폴더가 있는 위치 (기본값: 환경변수 {DATA_ROOT_ENV})')
+    args = parser.parse_args()
+    if args.data_root is not None:
+        # spawn 워커는 환경변수를 물려받아 utils를 import할 때 이 경로를 씀
+        os.environ[DATA_ROOT_ENV] = str(args.data_root.resolve())
+
+    worker_args = [(worker_id, args.sessions, args.reruns, args.timeout) for worker_id in range(args.processes)]
+    # spawn: 워커마다 캐시가 빈 새 프로세스에서 시작해야 cold 측정이 의미 있음
+    with ProcessPoolExecutor(args.processes, mp_context=get_context('spawn')) as pool:
+        results = list(pool.map(run_worker, *zip(*worker_args)))
+
+    metrics = summarize(results)
+    print(f"sessions={args.sessions} x processes={args.processes}, reruns/session={args.reruns}, "
+          f"total reruns={sum(len(r['latencies']) for r in results)}")
+    for page in PAGES:
+        cold = max(r['cold'][page] for r in results)
+        warm = max(r['warm'][page] for r in results)
+        print(f"  {page:<18} cold {cold:>8.1f}ms   warm {warm:>8.1f}ms")
+
+    budget = {} if args.no_budget else json.loads(args.budget.read_text(encoding='utf-8'))
+    failed = check_budget(metrics, budget)
+    print(f"{'metric':<16}{'value':>12}{'budget':>12}")
+    for name, value in metrics.items():
+        limit = budget.get(name)
+        mark = '' if limit is None else ('  FAIL' if name in failed else '  ok')
+        print(f"{name:<16}{value:>12.1f}{'' if limit is None else f'{limit:>12.1f}'}{mark}")
+
+    if args.json:
+        args.json.write_text(json.dumps(metrics, indent=2), encoding='utf-8')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
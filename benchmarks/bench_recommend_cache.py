@@ -0,0 +1,63 @@
+# =============================================================================
+# 추천 캐시 적중(hit) 지연시간 비교
+#  - 이전: @st.cache_resource prediction_TOP_3(df, _model) → 매 호출마다 df 전체 해싱
+#  - 이후: @st.cache_resource recommend_cluster(cluster_n, fingerprint) → 작은 키만 해싱
+# 실행: python -m benchmarks.bench_recommend_cache [--rows 1000000]
+# =============================================================================
+
+import argparse
+
+import numpy as np
+import streamlit as st
+
+from benchmarks.common import make_cluster_df, percentile_ms
+from utils.recommend import FEATURE_COLUMNS, MIN_DATA_COUNT, predict_top
+
+
+class ConstantModel:
+    """예측 비용을 빼고 캐시 키 비용만 보기 위한 더미 모델"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def predict(self, X):
+        return np.full(len(X), self.value)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    if args.rows < MIN_DATA_COUNT:
+        parser.error(f"--rows는 MIN_DATA_COUNT({MIN_DATA_COUNT}) 이상이어야 추천 결과가 나옵니다.")
+
+    df = make_cluster_df(args.rows)[list(FEATURE_COLUMNS)]
+    model = {'CVR': ConstantModel(0.05), 'CPA': ConstantModel(7.0)}
+    frames, models = {0: df}, {0: model}
+    fingerprint = b'bench'
+
+    @st.cache_resource
+    def prediction_TOP_3(df, _model):
+        return predict_top(df, _model)
+
+    @st.cache_resource
+    def recommend_cluster(cluster_n, fingerprint):
+        return predict_top(frames[cluster_n], models[cluster_n])
+
+    # 첫 호출(miss)로 캐시를 채운 뒤 hit만 측정
+    prediction_TOP_3(df, model)
+    recommend_cluster(0, fingerprint)
+
+    old_p50, old_p95 = percentile_ms(lambda: prediction_TOP_3(df, model), args.repeat)
+    new_p50, new_p95 = percentile_ms(lambda: recommend_cluster(0, fingerprint), args.repeat)
+
+    print(f"rows={args.rows:,}  (cache hit latency, ms)")
+    print(f"{'key':<28}{'p50':>10}{'p95':>10}")
+    print(f"{'hash(df) [before]':<28}{old_p50:>10.3f}{old_p95:>10.3f}")
+    print(f"{'cluster_n+fingerprint':<28}{new_p50:>10.3f}{new_p95:>10.3f}")
+    print(f"speedup(p50): {old_p50 / new_p50:,.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# =============================================================================
+# 서버 프로세스 여러 개의 데이터 메모리 비교 (프로세스별 로드 vs /dev/shm 공유)
+#  - process: 프로세스마다 매핑 표와 클러스터 데이터를 각자 읽음
+#             (디스크 Arrow 저장소가 없으면 CSV/Parquet을 파싱해 전용 메모리에 올림)
+#  - shared : 첫 프로세스가 SHARED_DATA_DIR에 올리고 나머지는 메모리 매핑으로 붙음
+# 실행: python -m benchmarks.bench_shared_data [--workers 4] [--data-root /tmp/scale_10x]
+#       (--data-root: tools.generate_synthetic_data로 만든 CSV만 있는 폴더로 규모 비교)
+# =============================================================================
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from utils.data_loader import DATA_ROOT_ENV, SHARED_DIR_ENV
+
+
+def memory_mb():
+    """(전용 메모리, PSS) MB — 공유 페이지는 PSS에 프로세스 수로 나눠 반영됨 (Linux 전용)"""
+    fields = {}
+    with open('/proc/self/smaps_rollup', encoding='utf-8') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    private = fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    return private / 1024, fields.get('Pss', 0) / 1024
+
+
+def run_worker(shared_dir, barrier):
+    """워커 하나: 매핑 표 + 모든 클러스터의 숫자 컬럼을 불러와 한 번씩 훑은 뒤 메모리 측정"""
+    if shared_dir is not None:
+        os.environ[SHARED_DIR_ENV] = str(shared_dir)
+    import utils.data_loader as data_loader
+
+    before, _ = memory_mb()
+
+    start = time.perf_counter()
+    mapping_df = data_loader.load_mapping_data()
+    frames = [data_loader.load_df(int(cluster_n), numeric_only=True)
+              for cluster_n in sorted(mapping_df['Cluster'].dropna().unique())]
+    # 페이지가 실제로 메모리에 올라오도록 전부 읽기
+    checksum = sum(float(df.to_numpy(dtype=float).sum()) for df in frames if df is not None)
+    elapsed = time.perf_counter() - start
+
+    # 모든 워커가 데이터를 붙든 상태에서 측정해야 PSS가 공유 수만큼 나뉨
+    barrier.wait()
+    private, pss = memory_mb()
+    barrier.wait()
+    return elapsed, private - before, pss, checksum
+
+
+def run_mode(shared_dir, workers):
+    context = get_context('spawn')
+    with context.Manager() as manager:
+        barrier = manager.Barrier(workers)
+        with ProcessPoolExecutor(workers, mp_context=context) as pool:
+            return list(pool.map(run_worker, [shared_dir] * workers, [barrier] * workers))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--data-root', type=Path, help=f"data/ 폴더가 있는 위치 (기본값: 환경변수 {DATA_ROOT_ENV})")
+    parser.add_argument('--shm', type=Path, default=Path('/dev/shm'), help="공유 폴더를 만들 위치")
+    args = parser.parse_args()
+    if args.data_root is not None:
+        # spawn 워커는 환경변수를 물려받아 utils를 import할 때 이 경로를 씀
+        os.environ[DATA_ROOT_ENV] = str(args.data_root.resolve())
+
+    shared_dir = Path(tempfile.mkdtemp(prefix='ive_bench_', dir=args.shm))
+    try:
+        print(f"{'mode':<10}{'load(s) max':>12}{'private(MB)':>13}{'PSS(MB)':>10}  (워커 {args.workers}개 합계)")
+        checksums = set()
+        for mode, target in (('process', None), ('shared', shared_dir)):
+            results = run_mode(target, args.workers)
+            checksums.update(round(checksum, 3) for *_, checksum in results)
+            print(f"{mode:<10}{max(r[0] for r in results):>12.2f}"
+                  f"{sum(r[1] for r in results):>13.1f}{sum(r[2] for r in results):>10.1f}")
+        assert len(checksums) == 1, "모드별로 읽은 데이터가 다릅니다"
+    finally:
+        shutil.rmtree(shared_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# =============================================================================
+# 벤치마크 공용: 반복 실행 시간 측정 + 합성 클러스터 데이터
+# =============================================================================
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.recommend import MIN_DATA_COUNT
+
+
+# =============================================================================
+# 1. 시간 측정
+# =============================================================================
+def run_times(func, repeat):
+    """func()를 repeat번 실행한 각각의 시간(초)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def best_ms(func, repeat):
+    """repeat번 실행 중 가장 빠른 시간(ms)"""
+    return min(run_times(func, repeat)) * 1000
+
+
+def percentile_ms(func, repeat):
+    """repeat번 실행 시간의 (p50, p95) ms"""
+    times = run_times(func, repeat)
+    return np.percentile(times, 50) * 1000, np.percentile(times, 95) * 1000
+
+
+# =============================================================================
+# 2. 합성 데이터
+# =============================================================================
+def make_cluster_df(rows, seed=0):
+    """ive_cluster_N.csv와 같은 컬럼의 합성 클러스터 데이터
+
+    (형태, 매체, 시간대) 조합은 조합당 평균 MIN_DATA_COUNT의 4배 행이 되도록 수를 줄여서 뽑습니다.
+    행마다 따로 뽑으면 가능한 조합 수(약 6.7만)에 비해 행이 적을 때 모든 조합이
+    MIN_DATA_COUNT 미만으로 걸러져 추천 결과가 비어 버립니다.
+    """
+    rng = np.random.default_rng(seed)
+    n_conditions = max(1, rows // (4 * MIN_DATA_COUNT))
+    conditions = pd.DataFrame({
+        'ads_shape': rng.integers(1, 8, n_conditions),
+        'mda_idx': rng.integers(1, 400, n_conditions),
+        'ads_time': rng.integers(0, 24, n_conditions),
+    })
+    df = conditions.iloc[rng.integers(0, n_conditions, rows)].reset_index(drop=True)
+    df['ads_category'] = rng.choice(['음식', '게임', '금융/보험', '교육/학습'], rows)
+    df['clicks'] = rng.integers(0, 5000, rows)
+    df['CVR'] = rng.random(rows) * 0.2
+    df['CPA'] = rng.lognormal(7, 1, rows)
+    df['rpt_time_turn'] = rng.poisson(3, rows).astype(float)
+    return df
+
+
+def make_cluster_csv(path, rows, seed=0):
+    """ive_cluster_N.csv와 같은 형태의 임시 CSV 생성 (utf-8 + 인덱스 컬럼)"""
+    make_cluster_df(rows, seed).to_csv(path, encoding='utf-8')
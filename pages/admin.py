@@ -0,0 +1,101 @@
+# =============================================================================
+# 운영 지표 페이지 (구간 소요 시간 / 캐시 적중률 / 메모리)
+# =============================================================================
+
+import streamlit as st
+import json
+from utils.metrics import span_table, cache_table, peak_rss_mb, snapshot, export_metrics, reset_spans
+from utils.recommend import get_model_registry
+from utils.warmup import start_warmup
+
+
+# =============================================================================
+# 1. 제목 설정
+# =============================================================================
+st.markdown(
+    """
+    <h2 style="margin-top: -30px; margin-bottom: 10px;">🛠️ 운영 지표</h2>
+    """,
+    unsafe_allow_html=True
+)
+st.caption("이 서버 프로세스에서 지금까지 측정한 값입니다 (세션 전체 합산).")
+
+
+# =============================================================================
+# 2. 요약
+# =============================================================================
+# 지표 파일에도 같이 기록하는 부가 정보 (워밍업 진행 상황 / 모델 레지스트리)
+extra = {
+    'warmup': start_warmup().snapshot(),
+    'model_registry': get_model_registry().stats(),
+}
+caches = cache_table()
+registry = extra['model_registry']
+peak = peak_rss_mb()
+
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("최대 메모리(RSS)", "-" if peak is None else f"{peak:,.0f} MB")
+col2.metric("캐시 메모리 추정", f"{caches['memory_mb'].sum():,.1f} MB")
+col3.metric("워밍업", f"{extra['warmup']['done']}/{extra['warmup']['total']}",
+            "완료" if extra['warmup']['ready'] else "진행 중")
+col4.metric("모델 레지스트리", f"{registry['used_bytes'] / (1024 * 1024):,.1f} MB",
+            f"{registry['loaded']}개 로드 / 제거 {registry['evictions']}회", delta_color="off")
+
+st.divider()
+
+
+# =============================================================================
+# 3. 구간 소요 시간
+# =============================================================================
+st.subheader("구간 소요 시간 (ms)")
+st.caption("페이지 번호 섹션(home/…, TOP_3/…), 데이터/모델 로드(data.*, model.*), 캐시 계산(cache:…)")
+
+spans = span_table()
+if spans.empty:
+    st.info("아직 측정값이 없습니다. 다른 페이지를 한 번 열어 주세요.")
+else:
+    st.dataframe(
+        spans, width='stretch', hide_index=True,
+        column_config={col: st.column_config.NumberColumn(format="%.1f")
+                       for col in ['mean_ms', 'p50_ms', 'p95_ms', 'max_ms', 'last_ms']}
+    )
+
+
+# =============================================================================
+# 4. 캐시 적중률 및 메모리
+# =============================================================================
+st.subheader("캐시 적중률 / 메모리 추정")
+st.caption("misses = 실제 계산 횟수, 메모리는 캐시된 값의 데이터 크기 합 (메모리 매핑된 데이터 포함)")
+st.dataframe(
+    caches, width='stretch', hide_index=True,
+    column_config={
+        'hit_rate': st.column_config.ProgressColumn(format="percent", min_value=0, max_value=1),
+        'memory_mb': st.column_config.NumberColumn(format="%.2f"),
+    }
+)
+
+
+# =============================================================================
+# 5. 내보내기
+# =============================================================================
+st.subheader("지표 내보내기")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if st.button("지표 파일로 저장", width='stretch'):
+        path = export_metrics(extra=extra)
+        st.success(f"저장했습니다: {path}")
+
+with col2:
+    st.download_button(
+        "JSON 다운로드",
+        json.dumps(snapshot(extra), ensure_ascii=False, indent=2, default=str),
+        file_name="metrics.json",
+        mime="application/json",
+        width='stretch'
+    )
+
+with col3:
+    if st.button("구간 측정값 초기화", width='stretch'):
+        reset_spans()
+        st.rerun()
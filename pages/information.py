@@ -2,101 +2,14 @@
 # 대시보드 소개 페이지
 # =============================================================================
 import streamlit as st
+from utils.theme import apply_page_style
 
 
 # =============================================================================
 # 1. CSS 설정
 # =============================================================================
-st.markdown("""
-<style>
-/* ==============================
-   KPI 카드 스타일
-============================== */
-.kpi-card {
-    background: #FFFFFF;
-    border-radius: 14px;
-    padding: 18px 20px;
-    width: 100%;
-    box-shadow:
-        0 4px 10px rgba(0,0,0,0.05),
-        0 12px 28px rgba(0,0,0,0.08);
-    border: 1px solid #E5E7EB;
-}
-
-.kpi-title {
-    font-size: 22px;
-    color: #6B7280;
-    margin-bottom: 6px;
-}
-
-.kpi-value {
-    font-size: 18px;
-    font-weight: 650;
-    color: #111827;
-}
-
-.kpi-sub {
-    font-size: 12px;
-    color: #9CA3AF;
-    margin-top: 4px;
-}
-
-/* ==============================
-   Info 카드 (페이지 소개용)
-============================== */
-.info-card {
-    background: #FFFFFF;
-    border-radius: 16px;
-    padding: 22px 24px;
-    width: 100%;
-    box-shadow:
-        0 6px 16px rgba(0,0,0,0.08),
-        0 12px 28px rgba(0,0,0,0.06);
-    border: 1px solid #E5E7EB;
-}
-
-.info-db-card {
-    background: #FFFFFF;
-    border-radius: 16px;
-    padding: 22px 24px;
-    width: 100%;
-    box-shadow:
-        0 6px 16px rgba(0,0,0,0.08),
-        0 12px 28px rgba(0,0,0,0.06);
-    border: 1px solid #E5E7EB;
-    padding-bottom: 28px;
-    padding-top: 28px;
-}
-                        
-.info-title {
-    font-size: 18px;
-    font-weight: 700;
-    margin-bottom: 6px;
-    color: #111827;
-}
-
-.info-desc {
-    font-size: 14px;
-    color: gray;
-    margin-bottom: 10px;
-}
-
-.info-list {
-    padding-left: 18px;
-    margin: 0;
-}
-
-.info-list li {
-    font-size: 14px;
-    color: #374151;
-    margin-bottom: 6px;
-}
-.info-list li.empty {
-    height: 22px;  
-    list-style: none;
-}
-</style>
-""", unsafe_allow_html=True)
+# 공통 스타일은 메인 스크립트에서 한 번에 주입, 여기서는 이 페이지 전용 값만
+apply_page_style('information')
 
 
 # =============================================================================
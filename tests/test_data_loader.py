@@ -0,0 +1,86 @@
+# =============================================================================
+# 매핑 프레임 공유/읽기 전용 확인 (data/ive_label_cluster.csv가 있어야 실행)
+# 실행: python -m pytest -q
+# =============================================================================
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from utils.data_loader import (
+    DATA_PATH, MAPPING_STORE_NAME, SCRIPT_DIR, SHARED_DIR_ENV, STORE_SUFFIX, load_mapping_data,
+)
+
+pytestmark = pytest.mark.skipif(not DATA_PATH.exists(), reason="data/ive_label_cluster.csv 없음")
+
+
+def run_home():
+    app = AppTest.from_file(str(SCRIPT_DIR / 'pages' / 'home.py'), default_timeout=60)
+    app.run()
+    assert not app.exception
+    return load_mapping_data()
+
+
+def test_mapping_arrays_shared_across_reruns():
+    first = run_home()
+    second = run_home()
+    assert first is second
+    for col in first.columns:
+        assert np.shares_memory(first[col].to_numpy(), second[col].to_numpy())
+
+
+@pytest.mark.parametrize('how', ['loc', 'iloc', 'array'])
+def test_mapping_columns_read_only(how):
+    mapping_df = run_home()
+    for pos, col in enumerate(mapping_df.columns):
+        before = mapping_df[col].iloc[0]
+        # 같은 타입의 값이어야 dtype 변환 오류가 아닌 읽기 전용 오류로 실패함
+        value = 'HACK' if isinstance(before, str) else before + 1
+        with pytest.raises(ValueError, match='read-only'):
+            if how == 'loc':
+                mapping_df.loc[mapping_df.index[0], col] = value
+            elif how == 'iloc':
+                mapping_df.iloc[0, pos] = value
+            else:
+                mapping_df[col].to_numpy()[0] = value
+        assert load_mapping_data()[col].iloc[0] == before
+
+
+def mapped_ranges(path):
+    """/proc/self/maps에서 path를 매핑한 주소 구간 목록 (Linux 전용)"""
+    ranges = []
+    with open('/proc/self/maps', encoding='utf-8') as f:
+        for line in f:
+            if line.rstrip().endswith(str(path)):
+                start, end = (int(address, 16) for address in line.split()[0].split('-'))
+                ranges.append((start, end))
+    return ranges
+
+
+@pytest.fixture
+def shared_mapping(tmp_path, monkeypatch):
+    """공유 모드로 다시 불러온 매핑 프레임 (끝나면 프로세스별 캐시로 되돌림)"""
+    monkeypatch.setenv(SHARED_DIR_ENV, str(tmp_path))
+    load_mapping_data.clear()
+    yield load_mapping_data(), tmp_path / f'{MAPPING_STORE_NAME}{STORE_SUFFIX}'
+    load_mapping_data.clear()
+
+
+@pytest.mark.skipif(not Path('/proc/self/maps').exists(), reason="Linux 전용")
+def test_shared_mapping_columns_point_into_shared_file(shared_mapping):
+    pa = pytest.importorskip('pyarrow')
+    mapping_df, store_path = shared_mapping
+    ranges = mapped_ranges(store_path)
+    assert ranges
+
+    def in_shared_file(address):
+        return any(start <= address < end for start, end in ranges)
+
+    for col in mapping_df.columns:
+        # Arrow 문자열 컬럼은 내부 배열 그대로, numpy 숫자 컬럼은 복사 없이 감싼 Arrow 배열
+        arrow = pa.array(mapping_df[col].array)
+        addresses = [buffer.address for chunk in getattr(arrow, 'chunks', [arrow])
+                     for buffer in chunk.buffers() if buffer is not None]
+        assert addresses and all(in_shared_file(address) for address in addresses), col
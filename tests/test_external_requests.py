@@ -0,0 +1,36 @@
+# =============================================================================
+# 화면에 외부 URL(폰트/CDN 등)이 남아 있지 않은지 확인 (브라우저 없이 AppTest로 렌더링)
+# 실행: python -m pytest -q
+# =============================================================================
+
+import re
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.bench_load_test import entry_script
+from utils.data_loader import SCRIPT_DIR
+
+PAGES = ('pages/home.py', 'pages/TOP_3.py', 'pages/information.py')
+# <link href=...>, <script src=...>, CSS url(...) / @import 안의 http(s) 주소만 검사 (본문 텍스트의 링크는 제외)
+EXTERNAL_PATTERN = re.compile(
+    r"""(?:href|src)\s*=\s*["']?(https?://[^"'\s>]+)|url\(\s*["']?(https?://[^"')\s]+)|@import\s+["'](https?://[^"']+)""",
+    re.IGNORECASE
+)
+
+
+def find_external_urls(script_path):
+    """스크립트를 한 번 실행하고 출력된 markdown/html 안의 외부 URL 목록 반환"""
+    app = AppTest.from_file(str(script_path), default_timeout=60)
+    app.run()
+    assert not app.exception
+    bodies = [element.value for element in app.markdown]
+    bodies += [element.proto.body for element in app.get('html')]
+    return [next(group for group in match.groups() if group)
+            for body in bodies for match in EXTERNAL_PATTERN.finditer(body)]
+
+
+@pytest.mark.parametrize('script_path', [entry_script()] + [SCRIPT_DIR / page for page in PAGES],
+                         ids=lambda path: path.name)
+def test_no_external_requests(script_path):
+    assert find_external_urls(script_path) == []
@@ -0,0 +1,60 @@
+# =============================================================================
+# 여러 클러스터 일괄 예측(predict_many)이 클러스터별 예측과 같은지 확인 (실제 모델 파일 없이 실행)
+# 실행: python -m pytest -q
+# =============================================================================
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from utils.inference import ClusterPredictor, predict_many
+from utils.recommend import FEATURE_COLUMNS, predict_top, rank_conditions, unique_conditions
+
+
+def make_conditions(rows, rng):
+    return pd.DataFrame({
+        'ads_shape': rng.integers(1, 8, rows),
+        'mda_idx': rng.integers(1, 30, rows),
+        'ads_time': rng.integers(0, 24, rows),
+    })
+
+
+def make_predictor(seed, shared_steps):
+    """CVR/CPA 모델 (shared_steps면 같은 전처리를 쓰는 Pipeline, 아니면 Ridge 단독)"""
+    rng = np.random.default_rng(seed)
+    X = make_conditions(200, rng)
+    model = {}
+    for target, y in (('CVR', rng.random(200) * 0.2), ('CPA', rng.lognormal(7, 1, 200))):
+        estimator = Ridge(alpha=seed + 1.0)
+        if shared_steps:
+            estimator = Pipeline([('scale', StandardScaler()), ('ridge', estimator)])
+        model[target] = estimator.fit(X, np.log1p(y))
+    return ClusterPredictor(model)
+
+
+def test_predict_many_matches_per_cluster_predict():
+    rng = np.random.default_rng(0)
+    clusters = {
+        cluster_n: (make_predictor(cluster_n, shared_steps=cluster_n % 2 == 0), make_conditions(rows, rng))
+        for cluster_n, rows in ((0, 50), (3, 1), (7, 120))
+    }
+    results = predict_many(clusters)
+
+    assert list(results) == list(clusters)
+    for cluster_n, (predictor, X) in clusters.items():
+        np.testing.assert_array_equal(results[cluster_n], predictor.predict(X))
+    # 결과는 모두 하나의 버퍼를 나눠 쓰는 뷰
+    base = results[0].base
+    assert base is not None and all(result.base is base for result in results.values())
+
+
+def test_batched_ranking_matches_predict_top():
+    rng = np.random.default_rng(1)
+    predictor = make_predictor(0, shared_steps=True)
+    df = make_conditions(20, rng).sample(3000, replace=True, random_state=0)[list(FEATURE_COLUMNS)]
+
+    conditions, data_count = unique_conditions(df)
+    predictions = predict_many({0: (predictor, conditions)})[0]
+    pd.testing.assert_frame_equal(rank_conditions(conditions, data_count, predictions), predict_top(df, predictor))
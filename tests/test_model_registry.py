@@ -0,0 +1,64 @@
+# =============================================================================
+# 모델 레지스트리의 LRU 제거 순서와 hits/misses/evictions 통계 확인 (실제 모델 파일 없이 실행)
+# 실행: python -m pytest -q
+# =============================================================================
+
+import numpy as np
+
+from utils.model_registry import ModelRegistry, heap_bytes
+
+
+def make_registry(budget_bytes, sizes):
+    """cluster_n → f'model_{cluster_n}'을 돌려주는 로더 + 고정 크기 sizer로 만든 레지스트리"""
+    loaded = []
+
+    def loader(cluster_n):
+        loaded.append(cluster_n)
+        return None if cluster_n not in sizes else f'model_{cluster_n}'
+
+    registry = ModelRegistry(loader, lambda cluster_n, model: sizes[cluster_n], budget_bytes)
+    return registry, loaded
+
+
+def test_least_recently_used_model_is_evicted_first():
+    registry, loaded = make_registry(250, {0: 100, 1: 100, 2: 100})
+    assert registry.get(0) == 'model_0'
+    assert registry.get(1) == 'model_1'
+    assert registry.get(0) == 'model_0'      # 0을 최근 사용으로 → 다음 제거 대상은 1
+    assert registry.get(2) == 'model_2'
+
+    stats = registry.stats()
+    assert list(stats['models']) == [0, 2]
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 3, 1)
+    assert stats['used_bytes'] == 200
+
+    assert registry.get(1) == 'model_1'      # 제거된 모델은 다시 불러옴, 이번엔 0이 제거됨
+    assert loaded == [0, 1, 2, 1]
+    stats = registry.stats()
+    assert list(stats['models']) == [2, 1]
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 4, 2)
+
+
+def test_model_over_budget_is_kept_alone():
+    registry, _ = make_registry(50, {0: 100, 1: 100})
+    registry.get(0)
+    registry.get(1)
+    stats = registry.stats()
+    assert list(stats['models']) == [1]      # 예산보다 커도 방금 불러온 모델 하나는 남김
+    assert stats['evictions'] == 1
+
+
+def test_missing_model_is_not_registered():
+    registry, loaded = make_registry(100, {})
+    assert registry.get(5) is None
+    assert registry.get(5) is None
+    assert loaded == [5, 5]
+    stats = registry.stats()
+    assert (stats['hits'], stats['misses'], stats['loaded']) == (0, 2, 0)
+
+
+def test_heap_bytes_skips_memory_mapped_arrays(tmp_path):
+    in_memory = np.zeros(1000)
+    mapped = np.memmap(tmp_path / 'coef.bin', dtype=np.float64, mode='w+', shape=(1000,))
+    model = {'CVR': [('scale', in_memory), ('ridge', mapped[10:])], 'CPA': in_memory}
+    assert heap_bytes(model) == in_memory.nbytes   # 같은 배열은 한 번만, 매핑된 배열(뷰 포함)은 제외
@@ -0,0 +1,84 @@
+# =============================================================================
+# 메모리 매핑 모델(.joblib)과 .pkl 모델의 예측값 일치 확인 (실제 모델 파일 없이 실행)
+# 실행: python -m pytest -q
+# =============================================================================
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('joblib')
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from utils.inference import ClusterPredictor
+from utils import model_store
+from utils.model_store import is_store_fresh, read_model_store, write_model_store
+from utils.recommend import FEATURE_COLUMNS
+
+
+def make_pipeline(X, y):
+    encoder = ColumnTransformer([('onehot', OneHotEncoder(handle_unknown='ignore'), list(FEATURE_COLUMNS))])
+    return Pipeline([('encode', encoder), ('ridge', Ridge(alpha=1.0))]).fit(X, y)
+
+
+@pytest.fixture
+def pkl_path(tmp_path):
+    """작은 CVR/CPA 파이프라인을 ive_model_cluster_0.pkl로 저장"""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({
+        'ads_shape': rng.integers(1, 8, 300),
+        'mda_idx': rng.integers(1, 50, 300),
+        'ads_time': rng.integers(0, 24, 300),
+    })
+    model = {
+        'CVR': make_pipeline(X, np.log1p(rng.random(300) * 0.2)),
+        'CPA': make_pipeline(X, np.log1p(rng.lognormal(7, 1, 300))),
+    }
+    path = tmp_path / 'ive_model_cluster_0.pkl'
+    with open(path, 'wb') as f:
+        pickle.dump(model, f)
+    return path
+
+
+def test_mmap_model_predicts_same_as_pickle(pkl_path):
+    write_model_store(pkl_path)
+    mapped = read_model_store(pkl_path)
+    assert mapped is not None
+    assert isinstance(mapped['CVR'][-1].coef_, np.memmap)
+
+    with open(pkl_path, 'rb') as f:
+        original = pickle.load(f)
+    rng = np.random.default_rng(1)
+    X = pd.DataFrame({
+        'ads_shape': rng.integers(1, 8, 200),
+        'mda_idx': rng.integers(1, 60, 200),      # 학습에 없던 매체 포함
+        'ads_time': rng.integers(0, 24, 200),
+    })
+    expected = ClusterPredictor(original).predict(X)
+    np.testing.assert_array_equal(ClusterPredictor(mapped).predict(X), expected)
+
+
+def test_stale_store_is_ignored(pkl_path):
+    write_model_store(pkl_path)
+    with open(pkl_path, 'ab') as f:
+        f.write(b'\0')                             # 원본이 바뀌면 서명이 달라짐
+    assert not is_store_fresh(pkl_path)
+    assert read_model_store(pkl_path) is None
+
+
+def test_freshness_check_does_not_load_model(pkl_path, monkeypatch):
+    assert not is_store_fresh(pkl_path)
+    write_model_store(pkl_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("최신 여부 확인에서 모델을 불러옴")
+
+    monkeypatch.setattr(model_store.joblib, 'load', fail)
+    assert is_store_fresh(pkl_path)
+    assert model_store.build_model_store(pkl_path.parent) == []
+    assert not list(pkl_path.parent.glob('*.tmp'))
@@ -0,0 +1,27 @@
+# =============================================================================
+# ClusterStats가 pandas describe()/corr()와 같은 결과를 경고 없이 내는지 확인
+# 실행: python -m pytest -q
+# =============================================================================
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.stats import ClusterStats
+
+
+@pytest.mark.parametrize('rows', [0, 1, 50])
+def test_all_nan_column_without_warnings(rows):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'CVR': rng.random(rows),
+        'CPA': np.full(rows, np.nan),
+        'clicks': rng.integers(0, 100, rows).astype(float),
+    })
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        stats = ClusterStats(df)
+    np.testing.assert_allclose(stats.describe.to_numpy(), df.describe().to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(stats.corr.to_numpy(), df.corr().to_numpy(), equal_nan=True)
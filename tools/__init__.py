@@ -0,0 +1,23 @@
+# =============================================================================
+# 도구 공용 --data-root 옵션 (data/, model/ 폴더 위치 바꾸기)
+# utils의 경로 상수(DATA_DIR, MODEL_DIR)는 import할 때 환경변수 IVE_DATA_ROOT로 정해지므로,
+# 각 도구는 main()에서 옵션을 파싱해 apply_data_root()로 환경변수에 옮긴 뒤에 utils 모듈을 import합니다.
+# =============================================================================
+
+import os
+from pathlib import Path
+
+from utils import DATA_ROOT_ENV
+
+DATA_ROOT_HELP = f"data/, model/ 폴더가 있는 위치 (기본값: 환경변수 {DATA_ROOT_ENV} 또는 프로젝트 폴더)"
+
+
+def add_data_root_argument(parser):
+    """각 도구의 argparse에 --data-root 추가"""
+    parser.add_argument('--data-root', type=Path, help=DATA_ROOT_HELP)
+
+
+def apply_data_root(args):
+    """--data-root가 있으면 환경변수로 옮김 (utils.data_loader를 import하기 전에 호출)"""
+    if args.data_root is not None:
+        os.environ[DATA_ROOT_ENV] = str(args.data_root.resolve())
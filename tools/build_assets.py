@@ -0,0 +1,18 @@
+# =============================================================================
+# 표시 크기별 최적화 이미지 생성 (image/optimized/)
+# 실행: python -m tools.build_assets
+# =============================================================================
+
+from utils.assets import MANIFEST_PATH, build_image_variants
+
+
+def main():
+    manifest = build_image_variants()
+    for key, entry in manifest.items():
+        saved = 1 - entry['bytes'] / entry['source_bytes']
+        print(f"{key:<24} {entry['source_bytes']:>8,}B → {entry['bytes']:>8,}B ({saved:.0%} 감소)  {entry['file']}")
+    print(f"manifest: {MANIFEST_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+# =============================================================================
+# CSV → Parquet 캐시 변환
+# 실행: python -m tools.build_cache [--data-root /tmp/scale_10x] [--data-dir data]
+# =============================================================================
+
+import argparse
+from pathlib import Path
+
+from tools import add_data_root_argument, apply_data_root
+
+
+def main():
+    parser = argparse.ArgumentParser(description="data 폴더의 CSV를 Parquet 캐시로 변환")
+    add_data_root_argument(parser)
+    parser.add_argument('--data-dir', type=Path, default=None, help="CSV 폴더 (기본값: --data-root 아래 data/)")
+    args = parser.parse_args()
+    apply_data_root(args)
+
+    # 경로 상수가 --data-root를 따르도록 환경변수를 정한 뒤에 import
+    from utils.data_loader import DATA_DIR, build_binary_cache
+
+    written = build_binary_cache(args.data_dir or DATA_DIR)
+    for path in written:
+        print(f"생성: {path}")
+    print(f"총 {len(written)}개 파일 변환 완료 (최신 캐시는 건너뜀)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# =============================================================================
+# 앱에서 쓰는 글자만 남긴 Noto Sans 웹폰트 생성 (static/fonts/)
+# 실행: python -m tools.build_fonts --latin-font "NotoSans[wdth,wght].ttf" \
+#                                  --hangul-font NotoSansCJK-Regular.otf
+# (pip install fonttools brotli 필요, 원본 폰트는 OFL 라이선스 Noto Sans / Noto Sans CJK)
+# =============================================================================
+
+import argparse
+import unicodedata
+from io import BytesIO
+from pathlib import Path
+
+from fontTools import subset
+from fontTools.ttLib import TTFont
+from fontTools.varLib import instancer
+
+from utils.assets import FONT_DIR, HANGUL_FONT_FILE, LATIN_FONT_FILE
+from utils.data_loader import DATA_PATH, SCRIPT_DIR
+
+# 라틴 폰트에 항상 포함할 범위 (기본 라틴 + Latin-1 + 일반 구두점 + 화살표/원화 기호)
+LATIN_RANGES = [(0x20, 0x7E), (0xA0, 0xFF), (0x2010, 0x2027), (0x2030, 0x203A), (0x20A9, 0x20A9), (0x2190, 0x2193)]
+HANGUL_RANGES = [(0xAC00, 0xD7A3), (0x3131, 0x318E)]
+
+
+def _in_ranges(char, ranges):
+    return any(start <= ord(char) <= end for start, end in ranges)
+
+
+def used_text():
+    """화면에 나올 수 있는 문자열 수집: 앱 소스(.py) + 매핑 데이터 라벨"""
+    sources = [SCRIPT_DIR.glob('*.py'), (SCRIPT_DIR / 'pages').glob('*.py'), (SCRIPT_DIR / 'utils').glob('*.py')]
+    text = ''.join(path.read_text(encoding='utf-8') for paths in sources for path in paths)
+    if DATA_PATH.exists():
+        text += DATA_PATH.read_text(encoding='euc-kr', errors='ignore')
+    return unicodedata.normalize('NFC', text)
+
+
+def subset_font(source, output, chars, pin_axes=None):
+    """필요한 글자만 남겨 woff2로 저장 (가변 폰트는 pin_axes 축을 고정)"""
+    font = TTFont(source)
+    if pin_axes:
+        # 축 고정 결과를 한 번 저장했다가 다시 열어야 subset이 글리프 테이블을 제대로 읽음
+        buffer = BytesIO()
+        instancer.instantiateVariableFont(font, pin_axes).save(buffer)
+        buffer.seek(0)
+        font = TTFont(buffer)
+
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['*']
+    options.name_IDs = ['*']
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=sorted({ord(c) for c in chars}))
+    subsetter.subset(font)
+    font.flavor = 'woff2'
+    font.save(output)
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱에서 쓰는 글자만 남긴 웹폰트 생성")
+    parser.add_argument('--latin-font', type=Path, required=True, help="Noto Sans (가변 폰트 가능)")
+    parser.add_argument('--hangul-font', type=Path, required=True, help="Noto Sans CJK/KR (한글 포함)")
+    args = parser.parse_args()
+
+    text = used_text()
+    latin = {chr(cp) for start, end in LATIN_RANGES for cp in range(start, end + 1)}
+    latin |= {c for c in text if 0x80 <= ord(c) < 0x3000 and not _in_ranges(c, HANGUL_RANGES)}
+    hangul = {c for c in text if _in_ranges(c, HANGUL_RANGES)}
+
+    FONT_DIR.mkdir(parents=True, exist_ok=True)
+    outputs = [
+        subset_font(args.latin_font, FONT_DIR / LATIN_FONT_FILE, latin, pin_axes={'wdth': 100}),
+        subset_font(args.hangul_font, FONT_DIR / HANGUL_FONT_FILE, hangul),
+    ]
+    print(f"라틴 {len(latin)}자 / 한글 {len(hangul)}자")
+    for output in outputs:
+        print(f"생성: {output} ({output.stat().st_size:,}B)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# =============================================================================
+# 클러스터 모델 .pkl → 메모리 매핑용 .joblib 변환 + 예측값 일치 확인
+# 실행: python -m tools.build_model_store [--force] [--no-verify] [--data-root /tmp/scale_10x]
+#       변환 후 두 모델의 예측이 하나라도 다르면 종료 코드 1
+# =============================================================================
+
+import argparse
+import pickle
+import sys
+
+import numpy as np
+
+from tools import add_data_root_argument, apply_data_root
+
+
+def model_clusters():
+    """model 폴더에 .pkl이 있는 클러스터 번호"""
+    from utils.recommend import MODEL_DIR
+    return sorted(int(path.stem.rsplit('_', 1)[-1]) for path in MODEL_DIR.glob('ive_model_cluster_*.pkl'))
+
+
+def predictions_match(cluster_n):
+    """클러스터 데이터의 모든 (형태, 매체, 시간대) 조합에서 .pkl과 .joblib 예측이 비트 단위로 같은지"""
+    from utils.data_loader import load_df
+    from utils.inference import ClusterPredictor
+    from utils.model_store import read_model_store
+    from utils.recommend import FEATURE_COLUMNS, model_path
+
+    with open(model_path(cluster_n), 'rb') as f:
+        original = ClusterPredictor(pickle.load(f))
+    mapped = read_model_store(model_path(cluster_n))
+    if mapped is None:
+        return False
+    mapped = ClusterPredictor(mapped)
+
+    df = load_df(cluster_n, columns=FEATURE_COLUMNS)
+    X = df.drop_duplicates().reset_index(drop=True)
+    return np.array_equal(original.predict(X), mapped.predict(X), equal_nan=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 .pkl을 메모리 매핑용 .joblib로 변환")
+    parser.add_argument('--force', action='store_true', help="최신 파일도 다시 변환")
+    parser.add_argument('--no-verify', action='store_true', help="예측값 비교 생략")
+    add_data_root_argument(parser)
+    args = parser.parse_args()
+    apply_data_root(args)
+
+    # 경로 상수가 --data-root를 따르도록 환경변수를 정한 뒤에 import
+    from utils.model_store import build_model_store
+    from utils.recommend import MODEL_DIR
+
+    written = build_model_store(MODEL_DIR, force=args.force)
+    for path in written:
+        print(f"생성: {path}")
+    print(f"총 {len(written)}개 모델 변환 완료 (최신 파일은 건너뜀)")
+    if args.no_verify:
+        return
+
+    mismatched = [cluster_n for cluster_n in model_clusters() if not predictions_match(cluster_n)]
+    if mismatched:
+        sys.exit(f"예측값이 다른 클러스터: {mismatched}")
+    print("모든 클러스터에서 .pkl과 .joblib 모델의 예측값이 같습니다.")
+
+
+if __name__ == '__main__':
+    main()
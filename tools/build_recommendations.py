@@ -0,0 +1,28 @@
+# =============================================================================
+# 클러스터별 추천표(TOP 10) 오프라인 생성
+# 실행: python -m tools.build_recommendations [--k 10] [--data-root /tmp/scale_10x]
+# =============================================================================
+
+import argparse
+
+from tools import add_data_root_argument, apply_data_root
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모든 클러스터 모델로 추천표를 미리 계산")
+    parser.add_argument('--k', type=int, default=None, help="클러스터별로 저장할 상위 조합 수 (기본값: TOP_K)")
+    add_data_root_argument(parser)
+    args = parser.parse_args()
+    apply_data_root(args)
+
+    # 경로 상수가 --data-root를 따르도록 환경변수를 정한 뒤에 import
+    from utils.recommend import TOP_K, build_recommendations
+
+    written = build_recommendations(args.k or TOP_K)
+    for path in written:
+        print(f"생성: {path}")
+    print(f"총 {len(written)}개 클러스터 추천표 생성 완료")
+
+
+if __name__ == '__main__':
+    main()
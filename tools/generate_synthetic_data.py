@@ -0,0 +1,218 @@
+# =============================================================================
+# 규모 테스트용 합성 데이터 / 모델 생성 (data/, model/ 폴더와 같은 형식)
+#  - data/ive_label_cluster.csv : euc-kr, ads_industry / ads_os_type / ads_month / Cluster
+#  - data/ive_cluster_{n}.csv   : utf-8 + 인덱스 컬럼, 광고 단위 행
+#  - model/ive_model_cluster_{n}.pkl : {'CVR': Pipeline, 'CPA': Pipeline} (log1p 타깃)
+# 실행: python -m tools.generate_synthetic_data --out /tmp/scale_10x --row-scale 10 --cluster-scale 10
+#       (1배 = 클러스터 5개 x 5만 행, 매핑 2천 행 / 이미 파일이 있으면 --force 없이는 중단)
+# =============================================================================
+
+import argparse
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import Ridge
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from utils.data_loader import DATA_ROOT, DATA_ROOT_ENV, MAPPING_READ_OPTIONS, CLUSTER_READ_OPTIONS
+from utils.recommend import FEATURE_COLUMNS
+
+
+# =============================================================================
+# 1. 설정 (1배 기준 규모)
+# =============================================================================
+BASE_CLUSTERS = 5
+BASE_CLUSTER_ROWS = 50_000
+BASE_MAPPING_ROWS = 2_000
+
+# 사이드바 선택지와 같은 값 (메인 스크립트 7번 섹션)
+INDUSTRIES = ["음식", "쇼핑/커머스", "게임", "금융/보험", "건강/운동", "생활/유틸리티", "엔터테인먼트", "법", "교육/학습"]
+OS_TYPES = ["Web", "Android", "iOS"]
+QUARTERS = ["1Q", "2Q", "3Q", "4Q"]
+# 매핑 표에서 아예 빠지는 조합 비율 ("데이터 부족" 화면 확인용)
+MISSING_COMBO_RATE = 0.08
+
+AD_SHAPES = 7            # ads_shape 1~7
+MEDIA_COUNT = 200        # mda_idx 1~200, 인기도는 지프 분포
+MEDIA_SKEW = 1.1
+
+CHUNK_ROWS = 1_000_000   # 큰 클러스터는 이 행 수씩 나눠서 CSV에 이어 씀
+FIT_ROWS = 200_000       # 모델 학습에 쓰는 최대 표본 수
+
+
+# =============================================================================
+# 2. 매핑 데이터
+# =============================================================================
+def make_mapping(n_rows, n_clusters, rng):
+    """광고 단위 매핑 표 (조합마다 대표 클러스터가 있고 일부 행은 다른 클러스터)
+
+    조합별 첫 행은 항상 대표 클러스터라 find_cluster 결과가 정해지고,
+    모든 클러스터가 최소 한 번은 등장합니다. 산업군 앞뒤 공백 / OS 대소문자는
+    실제 데이터처럼 섞어 두고 로더의 정리 단계에 맡깁니다.
+    """
+    combos = [(i, o, q) for i in INDUSTRIES for o in OS_TYPES for q in QUARTERS]
+    combos = [combo for combo in combos if rng.random() >= MISSING_COMBO_RATE]
+    home = rng.integers(0, n_clusters, len(combos))
+
+    # 조합별 대표 행(섞은 순서) → 등장하지 않은 클러스터 → 나머지 무작위 행
+    first = rng.permutation(len(combos))
+    rest = max(n_rows - len(combos), n_clusters)
+    picks = rng.integers(0, len(combos), rest)
+    clusters = np.where(rng.random(rest) < 0.9, home[picks], rng.integers(0, n_clusters, rest))
+    clusters[:n_clusters] = rng.permutation(n_clusters)
+
+    combo_idx = np.r_[first, picks]
+    df = pd.DataFrame(
+        [combos[i] for i in combo_idx],
+        columns=['ads_industry', 'ads_os_type', 'ads_month']
+    )
+    df['Cluster'] = np.r_[home[first], clusters]
+
+    noisy = rng.random(len(df)) < 0.05
+    df.loc[noisy, 'ads_industry'] = ' ' + df.loc[noisy, 'ads_industry'] + ' '
+    lower = rng.random(len(df)) < 0.05
+    df.loc[lower, 'ads_os_type'] = df.loc[lower, 'ads_os_type'].str.lower()
+    return df
+
+
+# =============================================================================
+# 3. 클러스터 데이터
+# =============================================================================
+class ClusterProfile:
+    """클러스터별 효과 크기 (광고 형태 / 매체 / 시간대가 CVR, CPA에 주는 영향)"""
+
+    def __init__(self, rng):
+        self.base_cvr = rng.normal(-3.0, 0.4)
+        self.base_cpa = rng.normal(7.5, 0.3)
+        self.shape_effect = rng.normal(0, 0.5, AD_SHAPES + 1)
+        self.media_effect = rng.normal(0, 0.4, MEDIA_COUNT + 1)
+        self.peak_hour = rng.integers(0, 24)
+        popularity = 1 / np.arange(1, MEDIA_COUNT + 1) ** MEDIA_SKEW
+        self.media_prob = rng.permutation(popularity / popularity.sum())
+        self.shape_prob = rng.dirichlet(np.full(AD_SHAPES, 2.0))
+
+    def sample(self, n_rows, rng):
+        """광고 n_rows개 (컬럼 순서는 원본 클러스터 CSV와 같음)"""
+        shape = rng.choice(np.arange(1, AD_SHAPES + 1), n_rows, p=self.shape_prob)
+        media = rng.choice(np.arange(1, MEDIA_COUNT + 1), n_rows, p=self.media_prob)
+        # 대표 시간대 주변에 몰리는 시작 시간
+        hour = np.rint(rng.normal(self.peak_hour, 4, n_rows)).astype(np.int64) % 24
+        hour_effect = 0.3 * np.cos((hour - self.peak_hour) / 24 * 2 * np.pi)
+
+        effect = self.shape_effect[shape] + self.media_effect[media] + hour_effect
+        cvr = 1 / (1 + np.exp(-(self.base_cvr + effect + rng.normal(0, 0.5, n_rows))))
+        cpa = np.round(np.exp(self.base_cpa - 0.6 * effect + rng.normal(0, 0.4, n_rows)))
+        clicks = rng.negative_binomial(2, 0.004, n_rows)
+        turn = rng.binomial(clicks, cvr)
+        return pd.DataFrame({
+            'ads_shape': shape,
+            'mda_idx': media,
+            'ads_time': hour,
+            'CVR': cvr,
+            'CPA': cpa,
+            'rpt_time_turn': turn,
+            'clicks': clicks,
+        })
+
+
+def fit_model(df):
+    """CVR/CPA 예측 모델 딕셔너리 (전처리 단계가 같아서 ClusterPredictor가 인코딩을 공유)"""
+    X = df[list(FEATURE_COLUMNS)]
+    model = {}
+    for target in ('CVR', 'CPA'):
+        pipeline = Pipeline([
+            ('enc', ColumnTransformer([
+                ('oh', OneHotEncoder(handle_unknown='ignore'), list(FEATURE_COLUMNS))
+            ])),
+            ('reg', Ridge()),
+        ])
+        pipeline.fit(X, np.log1p(df[target]))
+        model[target] = pipeline
+    return model
+
+
+def write_cluster(out_dir, cluster_n, n_rows, seed):
+    """클러스터 CSV와 모델 파일 하나 생성 (클러스터마다 독립 난수라 병렬/재실행해도 같은 결과)"""
+    rng = np.random.default_rng([seed, cluster_n])
+    profile = ClusterProfile(rng)
+    csv_path = out_dir / 'data' / f'ive_cluster_{cluster_n}.csv'
+
+    sample = None
+    for start in range(0, n_rows, CHUNK_ROWS):
+        chunk = profile.sample(min(CHUNK_ROWS, n_rows - start), rng)
+        chunk.index += start
+        chunk.to_csv(csv_path, encoding=CLUSTER_READ_OPTIONS['encoding'],
+                     mode='w' if start == 0 else 'a', header=start == 0)
+        if sample is None:
+            sample = chunk.sample(min(FIT_ROWS, len(chunk)), random_state=0)
+
+    with open(out_dir / 'model' / f'ive_model_cluster_{cluster_n}.pkl', 'wb') as f:
+        pickle.dump(fit_model(sample), f)
+    return cluster_n
+
+
+# =============================================================================
+# 4. 실행
+# =============================================================================
+def generate(out_dir, row_scale=1.0, cluster_scale=1.0, seed=0, jobs=1):
+    """out_dir/data, out_dir/model에 합성 데이터 생성 후 (클러스터 수, 클러스터당 행 수, 매핑 행 수) 반환"""
+    n_clusters = max(1, round(BASE_CLUSTERS * cluster_scale))
+    cluster_rows = max(1, round(BASE_CLUSTER_ROWS * row_scale))
+    mapping_rows = max(1, round(BASE_MAPPING_ROWS * row_scale))
+    (out_dir / 'data').mkdir(parents=True, exist_ok=True)
+    (out_dir / 'model').mkdir(parents=True, exist_ok=True)
+
+    mapping = make_mapping(mapping_rows, n_clusters, np.random.default_rng(seed))
+    mapping.to_csv(out_dir / 'data' / 'ive_label_cluster.csv',
+                   encoding=MAPPING_READ_OPTIONS['encoding'], index=False)
+
+    args = [(out_dir, cluster_n, cluster_rows, seed) for cluster_n in range(n_clusters)]
+    if jobs > 1:
+        with ProcessPoolExecutor(jobs) as pool:
+            list(pool.map(write_cluster, *zip(*args)))
+    else:
+        for arg in args:
+            write_cluster(*arg)
+    return n_clusters, cluster_rows, len(mapping)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="규모 테스트용 합성 데이터/모델 생성")
+    parser.add_argument('--out', type=Path, default=DATA_ROOT,
+                        help=f"data/, model/ 폴더를 만들 위치 (기본값: 환경변수 {DATA_ROOT_ENV} 또는 프로젝트 폴더)")
+    parser.add_argument('--row-scale', type=float, default=1.0, help="행 수 배율 (클러스터 CSV, 매핑 표)")
+    parser.add_argument('--cluster-scale', type=float, default=1.0, help="클러스터 수 배율")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--jobs', type=int, default=1, help="클러스터 파일을 만드는 프로세스 수")
+    parser.add_argument('--force', action='store_true', help="기존 data/model 파일이 있어도 덮어쓰기")
+    args = parser.parse_args()
+
+    existing = [path for folder in ('data', 'model') for path in (args.out / folder).glob('ive_*')]
+    if existing and not args.force:
+        sys.exit(f"{args.out}에 이미 data/model 파일이 {len(existing)}개 있습니다. "
+                 "다른 --out을 지정하거나 --force로 덮어쓰세요.")
+
+    start = time.perf_counter()
+    n_clusters, cluster_rows, mapping_rows = generate(
+        args.out, args.row_scale, args.cluster_scale, args.seed, args.jobs
+    )
+    print(f"생성: {args.out} (클러스터 {n_clusters}개 x {cluster_rows:,}행, 매핑 {mapping_rows:,}행, "
+          f"{time.perf_counter() - start:.1f}초)")
+    # 만든 데이터는 --data-root(도구/벤치마크) 또는 환경변수(앱)로 지정해야 읽힘
+    out = args.out.resolve()
+    print("캐시/모델 파일/추천표 만들기:")
+    print(f"  python -m tools.warmup --data-root {out}")
+    print("앱/부하 테스트:")
+    print(f"  {DATA_ROOT_ENV}={out} streamlit run <메인 스크립트>")
+    print(f"  python -m benchmarks.bench_load_test --data-root {out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+# =============================================================================
+# 공유 메모리 데이터 플레인 준비 (매핑 표 + 클러스터 데이터를 /dev/shm에 Arrow 파일로)
+# 실행: SHARED_DATA_DIR=/dev/shm/ive python -m tools.publish_shared_data [--clean] [--data-root /tmp/scale_10x]
+#       서버 프로세스들도 같은 SHARED_DATA_DIR로 띄우면 이 파일을 복사 없이 매핑해서 씀
+#       (미리 올리지 않아도 처음 필요한 프로세스가 한 번 만들어 올림)
+# =============================================================================
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from tools import add_data_root_argument, apply_data_root
+from utils import SHARED_DIR_ENV
+
+
+def main():
+    parser = argparse.ArgumentParser(description="매핑/클러스터 데이터를 공유 폴더에 Arrow 파일로 올리기")
+    parser.add_argument('--dir', type=Path, default=os.environ.get(SHARED_DIR_ENV),
+                        help=f"공유 폴더 (기본값: 환경변수 {SHARED_DIR_ENV})")
+    add_data_root_argument(parser)
+    parser.add_argument('--clean', action='store_true', help="올리지 않고 공유 폴더의 파일만 삭제 (메모리 반환)")
+    args = parser.parse_args()
+    if args.dir is None:
+        sys.exit(f"--dir 또는 환경변수 {SHARED_DIR_ENV}로 공유 폴더를 지정하세요 (예: /dev/shm/ive).")
+    apply_data_root(args)
+
+    # 경로 상수가 --data-root를 따르도록 환경변수를 정한 뒤에 import
+    from utils.data_loader import STORE_SUFFIX, publish_shared_data
+
+    if args.clean:
+        removed = [path for path in args.dir.glob('ive_*') if path.suffix in (STORE_SUFFIX, '.lock')]
+        for path in removed:
+            path.unlink()
+        print(f"삭제: {len(removed)}개 파일 ({args.dir})")
+        return
+
+    published = publish_shared_data(args.dir)
+    total_mb = sum(path.stat().st_size for path in args.dir.glob(f'ive_*{STORE_SUFFIX}')) / (1024 * 1024)
+    print(f"공유 폴더 {args.dir}: {len(published)}개 테이블, {total_mb:,.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# =============================================================================
+# 세션 없이 캐시 미리 만들기 + 워밍업 상태 파일 기록 (배포 직후/서버 시작 전 실행)
+# 실행: WARMUP_STATUS_FILE=/tmp/ive_warmup.json python -m tools.warmup [--workers 4] [--data-root /tmp/scale_10x]
+#       1) CSV 캐시(Parquet/Arrow), 모델 .joblib, 오래된 추천표를 디스크에 다시 만듦
+#       2) SHARED_DATA_DIR가 있으면 공유 폴더에도 올림
+#       3) 모든 클러스터를 이 프로세스에서 한 번 불러와 상태 파일에 결과 기록
+#          (실패한 클러스터가 있으면 종료 코드 1)
+#
+# st.cache_resource는 프로세스 메모리라 다른 프로세스에서 서버 캐시를 채울 수는 없고,
+# Streamlit은 첫 세션이 붙기 전에는 앱 코드를 실행하지 않습니다. 서버의 워밍업(start_warmup)은
+# 여전히 첫 세션에서 시작되지만, 이 도구를 먼저 돌려 두면 파싱/변환 없이 파일을 매핑만 합니다.
+# =============================================================================
+
+import argparse
+import logging
+import sys
+
+from tools import add_data_root_argument, apply_data_root
+
+
+def build_stale_recommendations():
+    """추천표가 없거나 모델/데이터가 바뀐 클러스터만 다시 계산"""
+    from utils.recommend import MODEL_DIR, load_recommendation, write_recommendation
+
+    written = []
+    for path in sorted(MODEL_DIR.glob('ive_model_cluster_*.pkl')):
+        cluster_n = int(path.stem.rsplit('_', 1)[-1])
+        if load_recommendation(cluster_n) is None:
+            written.append(write_recommendation(cluster_n))
+    # 방금 만든 추천표를 워밍업에서 다시 읽도록 None 결과를 비움
+    load_recommendation.clear()
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 없이 디스크 캐시를 만들고 워밍업 결과를 상태 파일에 기록")
+    parser.add_argument('--workers', type=int, default=None, help="워밍업 스레드 수 (기본: WARMUP_WORKERS 또는 최대 4)")
+    add_data_root_argument(parser)
+    args = parser.parse_args()
+    apply_data_root(args)
+
+    # 경로 상수가 --data-root를 따르도록 환경변수를 정한 뒤에 import
+    from utils.data_loader import build_binary_cache, publish_shared_data, shared_data_dir
+    from utils.model_store import build_model_store
+    from utils.recommend import MODEL_DIR
+    from utils.warmup import run_warmup
+
+    # 세션 밖(bare mode)에서 캐시를 호출할 때마다 나오는 경고 (이 도구에서는 정상, streamlit import 뒤에 설정)
+    logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').setLevel(logging.ERROR)
+
+    for step, build in (('데이터 캐시', build_binary_cache),
+                        ('모델 파일', lambda: build_model_store(MODEL_DIR)),
+                        ('추천표', build_stale_recommendations)):
+        try:
+            written = build()
+        except ImportError as error:
+            print(f"{step}: 건너뜀 ({error})")
+            continue
+        print(f"{step}: {len(written)}개 생성 (최신 파일은 건너뜀)")
+
+    shared_dir = shared_data_dir()
+    if shared_dir is not None:
+        print(f"공유 폴더 {shared_dir}: {len(publish_shared_data(shared_dir))}개 테이블")
+
+    progress = run_warmup(args.workers)
+    status = progress.snapshot()
+    print(f"워밍업: {status['done']}/{status['total']}개 클러스터, {status['elapsed_sec']}초")
+    if status['total'] == 0 or status['failed']:
+        sys.exit(f"실패한 클러스터: {status['failed'] or '매핑 데이터 없음'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+# =============================================================================
+# 환경변수 이름 (도구가 --data-root 등을 환경변수로 옮긴 뒤에 utils 모듈을 import하므로,
+# 그 전에도 참조할 수 있도록 부작용 없는 패키지 초기화 파일에 둠)
+# =============================================================================
+DATA_ROOT_ENV = 'IVE_DATA_ROOT'     # data/, model/ 폴더가 있는 위치
+SHARED_DIR_ENV = 'SHARED_DATA_DIR'  # 공유 메모리 데이터 플레인 폴더
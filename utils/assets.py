@@ -0,0 +1,206 @@
+# =============================================================================
+# 정적 이미지 자산 처리 (리사이즈/인코딩 결과를 메모리에 캐시)
+# =============================================================================
+
+import base64
+import hashlib
+import json
+import os
+import unicodedata
+from io import BytesIO
+from pathlib import Path
+from PIL import Image # pip install Pillow 필요
+
+from utils.metrics import tracked_cache
+
+
+# =============================================================================
+# 0. 경로 설정
+# =============================================================================
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+IMAGE_DIR = SCRIPT_DIR / "image"
+OPTIMIZED_DIR = IMAGE_DIR / "optimized"
+MANIFEST_PATH = OPTIMIZED_DIR / "manifest.json"
+
+# 페이지에서 실제로 표시하는 이미지와 st.image(..., width=) 크기
+DISPLAY_WIDTHS = {
+    '아열받아.jpg': (500,),
+}
+WEBP_QUALITY = 80
+
+# 웹폰트 (python -m tools.build_fonts 로 생성, Streamlit 정적 파일 경로 app/static/ 으로 제공)
+FONT_DIR = SCRIPT_DIR / "static" / "fonts"
+LATIN_FONT_FILE = "noto-sans-latin.woff2"
+HANGUL_FONT_FILE = "noto-sans-hangul.woff2"
+
+
+def find_image(name, image_dir=IMAGE_DIR):
+    """image 폴더에서 파일 찾기 (한글 파일명이 NFC/NFD 어느 쪽으로 저장돼 있어도 찾음)"""
+    target = unicodedata.normalize('NFC', name)
+    for path in Path(image_dir).iterdir():
+        if unicodedata.normalize('NFC', path.name) == target:
+            return path
+    raise FileNotFoundError(Path(image_dir) / name)
+
+
+# =============================================================================
+# 1. 이미지 처리 함수 (PNG 리사이징 및 Base64 변환)
+# =============================================================================
+def get_resized_png_b64(filename, new_width):
+    """PNG 파일을 열어서 크기를 조절하고 Base64 문자열로 반환"""
+    with open(filename, 'rb') as f:
+        img = Image.open(f)
+
+        # 혹시 모를 호환성 문제 방지를 위해 RGBA(투명 배경 지원) 모드로 변환
+        img = img.convert("RGBA")
+
+        # 이미지 비율 유지하며 리사이징 크기 계산
+        w_percent = (new_width / float(img.size[0]))
+        h_size = int((float(img.size[1]) * float(w_percent)))
+
+        # 고품질 리사이징 (LANCZOS 필터 사용)
+        resized_img = img.resize((new_width, h_size), Image.Resampling.LANCZOS)
+
+        # 메모리 버퍼에 PNG 형식으로 저장
+        buffer = BytesIO()
+        resized_img.save(buffer, format="PNG")
+
+        # Base64로 인코딩해서 문자열로 반환
+        return base64.b64encode(buffer.getvalue()).decode()
+
+
+# =============================================================================
+# 2. 커서 CSS (파일, 크기, 수정시각 조합당 한 번만 생성)
+# =============================================================================
+@tracked_cache
+def _build_cursor_css(filename, new_width, hotspot_x, hotspot_y, mtime_ns):
+    # mtime_ns는 캐시 키로만 사용 (이미지가 바뀌면 새로 생성)
+    cursor_b64 = get_resized_png_b64(filename, new_width)
+    cursor_css_value = f'url("data:image/png;base64,{cursor_b64}") {hotspot_x} {hotspot_y}, auto !important'
+
+    return f"""
+    <style>
+    /* 전체 페이지 적용 */
+    * {{
+        cursor: {cursor_css_value};
+    }}
+    
+    /* 사이드바 영역 강제 적용 */
+    section[data-testid="stSidebar"] * {{
+        cursor: {cursor_css_value};
+    }}
+    
+    /* 버튼, 입력창 등 인터랙티브 요소 강제 적용 */
+    button, select, input, textarea, label, a, div[data-testid="stMetricValue"] {{
+        cursor: {cursor_css_value};
+    }}
+    </style>
+    """
+
+
+def cursor_css(filename, new_width, hotspot_x=0, hotspot_y=0):
+    """커서 이미지 CSS 문자열 반환 (rerun마다 stat 한 번만, 리사이즈/인코딩은 캐시)"""
+    mtime_ns = os.stat(filename).st_mtime_ns
+    return _build_cursor_css(str(filename), new_width, hotspot_x, hotspot_y, mtime_ns)
+
+
+# =============================================================================
+# 3. 표시 크기별 최적화 이미지 (python -m tools.build_assets 로 생성)
+# =============================================================================
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _variant_key(name, width):
+    return f"{unicodedata.normalize('NFC', name)}@{width}"
+
+
+def build_image_variants(display_widths=DISPLAY_WIDTHS):
+    """표시 크기에 맞춰 줄이고 WebP로 다시 압축한 변형 이미지 + manifest 생성
+
+    원본보다 크게 표시하는 경우에는 원본 크기 그대로 재압축만 합니다.
+    manifest에는 원본 해시를 남겨서, 원본이 바뀌면 변형은 자동으로 무시됩니다.
+    """
+    OPTIMIZED_DIR.mkdir(exist_ok=True)
+    manifest = {}
+    for name, widths in display_widths.items():
+        source = find_image(name)
+        digest = _file_digest(source)
+        with Image.open(source) as img:
+            img.load()
+            for width in widths:
+                target_width = min(width, img.size[0])
+                h_size = round(img.size[1] * target_width / img.size[0])
+                variant = img.resize((target_width, h_size), Image.Resampling.LANCZOS)
+                variant_name = f"{unicodedata.normalize('NFC', source.stem)}_w{width}.webp"
+                variant.save(OPTIMIZED_DIR / variant_name, format="WEBP", quality=WEBP_QUALITY, method=6)
+                manifest[_variant_key(name, width)] = {
+                    'file': variant_name,
+                    'source_sha256': digest,
+                    'bytes': (OPTIMIZED_DIR / variant_name).stat().st_size,
+                    'source_bytes': source.stat().st_size,
+                }
+
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+@tracked_cache
+def _load_variants():
+    """manifest에서 원본 해시가 일치하는 변형만 골라 {키: 경로} 반환 (프로세스당 한 번 확인)"""
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    variants = {}
+    for key, entry in manifest.items():
+        name = key.rsplit('@', 1)[0]
+        path = OPTIMIZED_DIR / entry['file']
+        try:
+            if path.exists() and _file_digest(find_image(name)) == entry['source_sha256']:
+                variants[key] = path
+        except FileNotFoundError:
+            continue
+    return variants
+
+
+def image_path(name, width=None):
+    """표시 크기에 맞는 최적화 이미지 경로 (변형이 없거나 오래됐으면 원본 경로)"""
+    if width is not None:
+        variant = _load_variants().get(_variant_key(name, width))
+        if variant is not None:
+            return variant
+    return find_image(name)
+
+
+# =============================================================================
+# 4. 자체 호스팅 웹폰트 (외부 Google Fonts 요청 없음)
+# =============================================================================
+FONT_CSS = f"""
+    /* 라틴 글자: Noto Sans (가변 굵기) */
+    @font-face {{
+        font-family: 'Noto Sans';
+        src: url("app/static/fonts/{LATIN_FONT_FILE}") format("woff2");
+        font-weight: 100 900;
+        font-display: swap;
+        unicode-range: U+0000-00FF, U+2010-203A, U+20A9, U+2190-2193;
+    }}
+
+    /* 한글: Noto Sans CJK에서 앱에 쓰는 글자만 추출 */
+    @font-face {{
+        font-family: 'Noto Sans';
+        src: url("app/static/fonts/{HANGUL_FONT_FILE}") format("woff2");
+        font-weight: 400;
+        font-display: swap;
+        unicode-range: U+AC00-D7A3, U+3131-318E;
+    }}
+
+    /* 전체 앱 폰트 변경 */
+    html, body, [class*="css"] {{
+        font-family: 'Noto Sans', sans-serif;
+    }}
+"""
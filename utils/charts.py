@@ -0,0 +1,178 @@
+# =============================================================================
+# Altair 차트 스펙 캐시 (home.py 클러스터 차트 / 상관 히트맵 / TOP_3.py 예산 도넛 공용)
+# =============================================================================
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+import json
+
+from utils.stats import cluster_composition, load_cluster_stats
+from utils.recommend import get_recommendation, split_top3
+from utils.metrics import tracked_cache
+
+
+# =============================================================================
+# 1. 차트 정의 (클러스터 번호 → (데이터, Altair 차트))
+# =============================================================================
+# 상관계수 히트맵: 이 컬럼 수 이하일 때만 칸에 숫자 표시 / 행 높이(px)
+CORR_LABEL_MAX_COLUMNS = 20
+CORR_CELL_HEIGHT = 36
+
+
+def composition_chart(cluster_n):
+    """클러스터 구성(산업군/OS/분기) 빈도 막대 차트"""
+    final_chart_df = cluster_composition(cluster_n)
+    if final_chart_df.empty:
+        return None, None
+
+    chart = alt.Chart(final_chart_df).mark_bar(
+        cornerRadiusTopLeft=5,
+        cornerRadiusTopRight=5
+    ).encode(
+        x=alt.X('Label', sort=None, title=None, axis=alt.Axis(labelAngle=0)),
+        y=alt.Y('Count', title='빈도수'),
+        color=alt.Color('Category', title='구분',
+                        scale=alt.Scale(range=['#FF6C6C', '#4CA8FF', '#56D97D'])),
+        tooltip=['Category', 'Label', 'Count']
+    ).properties(
+        height=300,
+        width='container'
+    ).configure_axis(
+        grid=False,
+        labelFontSize=12
+    ).configure_view(
+        strokeWidth=0
+    )
+    return final_chart_df, chart
+
+
+def budget_chart(cluster_n):
+    """TOP 3 효율 점수 비율로 나눈 광고 예산 도넛 차트"""
+    _, _, _, top = split_top3(get_recommendation(cluster_n))
+    top_chart = top.copy()
+    rank_order = ['TOP 1', 'TOP 2', 'TOP 3']
+    color_range = ['#FF6C6C', '#4CA8FF', '#56D97D']
+
+    # 수식 계산(예산 분배 방법)
+    total_score = top_chart['score'].sum()
+    top_chart['rate_val'] = (top_chart['score'] / total_score) * 100
+    top_chart['rate_val'] = top_chart['rate_val'].round(1)
+    top_chart['rate_str'] = top_chart['rate_val'].astype(str) + "%"
+    top_chart['rank_label'] = [f'TOP {i+1}' for i in range(len(top_chart))]
+
+    # 차트 및 범례 생성
+    base = alt.Chart(top_chart).encode(
+        theta=alt.Theta("rate_val", stack=True)
+    )
+
+    pie = base.mark_arc(outerRadius=110, innerRadius=65).encode(
+        color=alt.Color("rank_label",
+                        scale=alt.Scale(domain=rank_order, range=color_range),
+                        sort=rank_order,
+                        legend=alt.Legend(
+                            orient='none',
+                            legendX=48,
+                            legendY=20,
+                            direction='vertical',
+                            title=None,
+                            labelFontSize=16,
+                            symbolType='circle'
+                        )),
+        order=alt.Order("rank_label", sort="ascending"),
+        tooltip=["rank_label", "rate_str"]
+    )
+
+    # 도넛 위에 라벨
+    text = base.mark_text(radius=155, fontSize=24).encode(
+        text=alt.Text("rate_str"),
+        order=alt.Order("rank_label", sort="ascending"),
+        color=alt.value("black")
+    )
+
+    chart = (pie + text).properties(
+        height=350
+    )
+    return top_chart, chart
+
+
+def correlation_chart(cluster_n):
+    """숫자 컬럼 간 상관계수 히트맵 (rect 하나, 컬럼이 적을 때만 칸마다 숫자 표시)
+
+    상관행렬을 변수당 한 행인 넓은 표 그대로 보내고 Vega-Lite fold로 펼치므로
+    컬럼이 수백 개여도 행 수는 컬럼 수만큼만 늘어납니다.
+    """
+    cluster_stats = load_cluster_stats(cluster_n)
+    if cluster_stats is None or cluster_stats.corr.empty:
+        return None, None
+
+    columns = [str(col) for col in cluster_stats.corr.columns]
+    corr_df = pd.DataFrame(cluster_stats.corr.to_numpy(), columns=columns)
+    corr_df.insert(0, 'row', columns)
+    # 필드 이름의 '.'은 Vega-Lite에서 중첩 접근으로 해석되므로 이스케이프
+    fold_fields = [col.replace('.', '\\.') for col in columns]
+
+    base = alt.Chart(corr_df).transform_fold(
+        fold_fields, as_=['column', 'corr']
+    ).encode(
+        x=alt.X('column:N', sort=columns, title=None, axis=alt.Axis(labelAngle=-45)),
+        y=alt.Y('row:N', sort=columns, title=None)
+    )
+
+    heatmap = base.mark_rect().encode(
+        color=alt.Color('corr:Q', title='상관계수',
+                        scale=alt.Scale(scheme='redyellowblue', domain=[-1, 1])),
+        tooltip=['row:N', 'column:N', alt.Tooltip('corr:Q', format='.3f')]
+    )
+
+    chart = heatmap
+    if len(columns) <= CORR_LABEL_MAX_COLUMNS:
+        text = base.mark_text(fontSize=12).encode(
+            text=alt.Text('corr:Q', format='.2f'),
+            color=alt.condition('abs(datum.corr) > 0.6', alt.value('white'), alt.value('black'))
+        )
+        chart = heatmap + text
+
+    chart = chart.properties(
+        height=min(max(len(columns) * CORR_CELL_HEIGHT, 200), 900)
+    ).configure_view(
+        strokeWidth=0
+    )
+    return corr_df, chart
+
+
+CHART_BUILDERS = {
+    'composition': composition_chart,
+    'budget': budget_chart,
+    'correlation': correlation_chart,
+}
+
+
+# =============================================================================
+# 2. 스펙 캐시 및 출력
+# =============================================================================
+@tracked_cache
+def load_chart_spec(kind, cluster_n):
+    """(차트 종류, 클러스터)별 Vega-Lite 스펙 JSON + 데이터 이름 + 데이터 (그릴 데이터가 없으면 None)
+
+    Altair 객체 생성/스키마 검증/직렬화는 여기서 한 번만 하고, 데이터는 스펙에 넣지 않고
+    DataFrame 그대로 보관합니다 (출력할 때 Streamlit이 Arrow로 보냄).
+    """
+    data, chart = CHART_BUILDERS[kind](cluster_n)
+    if chart is None:
+        return None
+
+    datasets = {}
+    # top_level=False: Altair 기본 테마를 섞지 않음 (st.altair_chart도 테마를 끄고 변환)
+    spec = chart.to_dict(context={'top_level': False, 'datasets': datasets})
+    spec['$schema'] = alt.SCHEMA_URL
+    (data_name,) = datasets
+    return json.dumps(spec), data_name, data
+
+
+def show_chart(chart_spec):
+    """캐시된 스펙으로 차트 출력 (스펙은 매번 같은 내용이라 프런트엔드는 다시 그리지 않음)"""
+    spec_json, data_name, data = chart_spec
+    spec = json.loads(spec_json)
+    spec['datasets'] = {data_name: data}
+    st.vega_lite_chart(spec, width='stretch')
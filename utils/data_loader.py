@@ -0,0 +1,447 @@
+# =============================================================================
+# 공통 데이터 로더 (home.py / TOP_3.py 공용)
+# =============================================================================
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from utils import DATA_ROOT_ENV, SHARED_DIR_ENV
+from utils.metrics import span, tracked_cache
+
+try:
+    # pip install pyarrow 필요 (없으면 항상 CSV로 읽음)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    # 공유 모드에서 같은 파일을 한 프로세스만 만들도록 잠금 (Windows에는 없음)
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+# =============================================================================
+# 1. 경로 설정
+# =============================================================================
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+# 환경변수 IVE_DATA_ROOT=/tmp/scale_10x 처럼 지정하면 그 아래의 data/, model/ 폴더를 읽음
+# (tools.generate_synthetic_data로 만든 규모 테스트용 데이터, 없으면 프로젝트 폴더)
+DATA_ROOT = Path(os.environ.get(DATA_ROOT_ENV) or SCRIPT_DIR).resolve()
+DATA_DIR = DATA_ROOT / "data"
+DATA_PATH = DATA_DIR / 'ive_label_cluster.csv'
+MAPPING_KEYS = ['ads_industry', 'ads_os_type', 'ads_month']
+
+# 파일별 CSV 읽기 옵션 (매핑 파일은 euc-kr, 클러스터 파일은 utf-8 + 인덱스 컬럼)
+MAPPING_READ_OPTIONS = {'encoding': 'euc-kr'}
+CLUSTER_READ_OPTIONS = {'encoding': 'utf-8', 'index_col': 0}
+
+
+# =============================================================================
+# 2. 문자열 정리
+# =============================================================================
+def make_key(industry, os_type, month):
+    """(산업군, OS, 분기) 입력값을 조회용 키로 정리(공백 제거 + OS 소문자 변환)"""
+    return (
+        str(industry).strip(),
+        str(os_type).strip().lower(),
+        str(month).strip(),
+    )
+
+
+# =============================================================================
+# 3. 바이너리 캐시 (매핑: Parquet / 클러스터: 메모리 매핑용 Arrow IPC)
+# =============================================================================
+CACHE_SUFFIX = '.parquet'
+STORE_SUFFIX = '.arrow'
+SIGNATURE_KEY = b'source_signature'
+INDEX_KEY = b'index_column'
+
+
+def cache_path_for(csv_path, suffix=CACHE_SUFFIX):
+    """CSV 옆에 저장되는 캐시 파일 경로"""
+    return Path(csv_path).with_suffix(suffix)
+
+
+def source_signature(path):
+    """원본 파일의 크기 + 수정시각(ns), 이 값이 바뀌면 캐시는 무효"""
+    stat = os.stat(path)
+    return f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+
+def _read_schema(cache_path):
+    """캐시 파일의 스키마만 읽기 (데이터는 읽지 않음)"""
+    if cache_path.suffix == STORE_SUFFIX:
+        with pa.memory_map(str(cache_path), 'r') as source:
+            return pa.ipc.open_file(source).schema
+    return pq.read_schema(cache_path)
+
+
+def is_cache_fresh(csv_path, suffix=CACHE_SUFFIX):
+    """캐시 파일이 있고 현재 CSV로부터 만들어진 것인지 확인"""
+    cache_path = cache_path_for(csv_path, suffix)
+    if pq is None or not cache_path.exists():
+        return False
+    try:
+        metadata = _read_schema(cache_path).metadata or {}
+    except (OSError, pa.ArrowException):
+        return False
+    return metadata.get(SIGNATURE_KEY) == source_signature(csv_path)
+
+
+def _to_arrow(df, signature, preserve_index=None, extra_metadata=None):
+    """DataFrame → Arrow 테이블 (원본 CSV 서명을 스키마 메타데이터에 기록)"""
+    table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SIGNATURE_KEY] = signature
+    metadata.update(extra_metadata or {})
+    return table.replace_schema_metadata(metadata)
+
+
+def _replace_atomically(cache_path, write):
+    """다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓰고 교체"""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    write(tmp_path)
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+def write_binary_cache(csv_path, read_options):
+    """CSV를 한 번 파싱해서 타입이 고정된 Parquet 캐시로 저장
+
+    문자열 컬럼은 Parquet 사전(dictionary) 인코딩으로 저장되어 크기가 줄고,
+    읽을 때는 원래 dtype 그대로 복원됩니다.
+    """
+    if pq is None:
+        raise ImportError("Parquet 캐시를 만들려면 pyarrow가 필요합니다.")
+    csv_path = Path(csv_path)
+    signature = source_signature(csv_path)
+    table = _to_arrow(pd.read_csv(csv_path, **read_options), signature)
+    return _replace_atomically(
+        cache_path_for(csv_path),
+        lambda path: pq.write_table(table, path, use_dictionary=True)
+    )
+
+
+def _store_table(df, signature):
+    """DataFrame → Arrow 저장소용 테이블 (인덱스는 일반 컬럼으로, 이름만 메타데이터에)"""
+    index_name = str(df.index.name) if df.index.name is not None else '__index__'
+    df = df.rename_axis(index_name).reset_index()
+    return _to_arrow(df, signature, preserve_index=False,
+                     extra_metadata={INDEX_KEY: index_name.encode()})
+
+
+def write_ipc_file(table, store_path):
+    """Arrow 테이블을 비압축 IPC 파일로 저장 (교체 방식)"""
+    def write(path):
+        with pa.OSFile(str(path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    return _replace_atomically(Path(store_path), write)
+
+
+def write_cluster_store(csv_path):
+    """클러스터 CSV를 비압축 Arrow IPC 파일로 저장 (메모리 매핑으로 바로 읽기 위함)
+
+    압축하지 않아야 숫자 컬럼을 복사 없이 매핑할 수 있습니다.
+    인덱스는 일반 컬럼으로 저장하고 이름만 메타데이터에 남깁니다.
+    """
+    if pa is None:
+        raise ImportError("Arrow 저장소를 만들려면 pyarrow가 필요합니다.")
+    csv_path = Path(csv_path)
+    signature = source_signature(csv_path)
+    df = pd.read_csv(csv_path, **CLUSTER_READ_OPTIONS)
+    return write_ipc_file(_store_table(df, signature), cache_path_for(csv_path, STORE_SUFFIX))
+
+
+def build_binary_cache(data_dir=DATA_DIR):
+    """data 폴더의 CSV를 캐시로 변환 (매핑 → Parquet, 클러스터 → Arrow, 최신 캐시는 건너뜀)"""
+    data_dir = Path(data_dir)
+    written = []
+    for csv_path in sorted(data_dir.glob('ive_*.csv')):
+        if csv_path.name == DATA_PATH.name:
+            if not is_cache_fresh(csv_path):
+                written.append(write_binary_cache(csv_path, MAPPING_READ_OPTIONS))
+        elif not is_cache_fresh(csv_path, STORE_SUFFIX):
+            written.append(write_cluster_store(csv_path))
+    return written
+
+
+def read_table(csv_path, read_options):
+    """최신 Parquet 캐시가 있으면 그걸 읽고, 아니면 CSV로 대체"""
+    if is_cache_fresh(csv_path):
+        with span('data.read_parquet'):
+            return pd.read_parquet(cache_path_for(csv_path))
+    with span('data.read_csv'):
+        return pd.read_csv(csv_path, **read_options)
+
+
+# =============================================================================
+# 4. 매핑 데이터 로드
+# =============================================================================
+def _freeze(series):
+    """컬럼을 읽기 전용 numpy 배열로 고정 (이미 읽기 전용인 배열은 복사하지 않음)
+
+    Arrow 문자열 컬럼(ArrowStringArray)은 값을 대입하면 내부 배열을 통째로 바꿔 끼우므로
+    막을 수 없어서, object 배열로 바꾼 뒤 고정합니다.
+    """
+    values = series.to_numpy(dtype=None if isinstance(series.dtype, np.dtype) else object)
+    if values.flags.writeable:
+        values = values.copy()
+        values.flags.writeable = False
+    return pd.Series(values, index=series.index, dtype=values.dtype, copy=False)
+
+
+def freeze_frame(df):
+    """모든 컬럼을 읽기 전용으로 고정한 프레임 (세션 간 공유용)"""
+    return pd.DataFrame({col: _freeze(series) for col, series in df.items()}, copy=False)
+
+
+def normalized_mapping():
+    """매핑 파일을 읽어 조회용으로 정리 (산업군/분기 공백 제거, OS 소문자)"""
+    mapping_df = read_table(DATA_PATH, MAPPING_READ_OPTIONS)
+    mapping_df['ads_industry'] = mapping_df['ads_industry'].astype(str).str.strip()
+    mapping_df['ads_os_type'] = mapping_df['ads_os_type'].astype(str).str.strip().str.lower()
+    mapping_df['ads_month'] = mapping_df['ads_month'].astype(str).str.strip()
+    return mapping_df
+
+
+@tracked_cache
+def load_mapping_data():
+    """매핑 데이터를 불러와 로드 시점에 한 번만 정리하고, 읽기 전용 프레임을 세션 간 공유
+
+    st.cache_resource라 매 rerun마다 같은 객체를 그대로 돌려주므로(복사/해싱 없음)
+    페이지에서는 절대 컬럼을 덮어쓰지 말고 조회만 해야 합니다.
+    """
+    if not os.path.exists(DATA_PATH):
+        return None
+    shared_dir = shared_data_dir()
+    if shared_dir is not None:
+        table = shared_mapping_table(shared_dir)
+        if table is not None:
+            # 숫자 컬럼은 읽기 전용 numpy 뷰, 문자열 컬럼은 Arrow 배열 그대로라 모두 공유 메모리를 가리킴
+            # (매핑된 버퍼는 수정할 수 없으므로 object 배열로 복사해 고정하지 않음)
+            return store_to_frame(table)
+    return freeze_frame(normalized_mapping())
+
+
+# =============================================================================
+# 5. 클러스터 조회 인덱스
+# =============================================================================
+@tracked_cache
+def load_cluster_index():
+    """(산업군, OS, 분기) → Cluster 딕셔너리 (같은 키는 첫 번째 행 우선)"""
+    mapping_df = load_mapping_data()
+    if mapping_df is None:
+        return {}
+
+    valid = mapping_df[mapping_df['Cluster'].notna()]
+    keys = valid[MAPPING_KEYS].itertuples(index=False, name=None)
+
+    cluster_index = {}
+    for key, cluster in zip(keys, valid['Cluster']):
+        cluster_index.setdefault(key, int(cluster))
+    return cluster_index
+
+
+def find_cluster(industry, os_type, month):
+    """선택한 조합의 클러스터 번호 반환 (없으면 None)"""
+    return load_cluster_index().get(make_key(industry, os_type, month))
+
+
+# =============================================================================
+# 6. 클러스터 데이터 로드 (메모리 매핑 + 필요한 컬럼만)
+# =============================================================================
+def cluster_csv_path(cluster_n):
+    """클러스터 원본 CSV 경로"""
+    return DATA_DIR / f'ive_cluster_{cluster_n}.csv'
+
+
+@tracked_cache
+def open_cluster_store(cluster_n):
+    """클러스터 Arrow 파일을 메모리 매핑으로 열기 (최신 저장소가 없으면 None)
+
+    파일 내용은 OS 페이지 캐시에 한 벌만 올라가므로 세션/프로세스가 몇 개든
+    물리 메모리는 공유됩니다. 공유 모드(SHARED_DATA_DIR)에서는 공유 폴더의 파일을 엽니다.
+    """
+    csv_path = cluster_csv_path(cluster_n)
+    if not os.path.exists(csv_path):
+        return None
+    shared_dir = shared_data_dir()
+    if shared_dir is not None:
+        table = shared_cluster_table(cluster_n, shared_dir)
+        if table is not None:
+            return table
+    if not is_cache_fresh(csv_path, STORE_SUFFIX):
+        return None
+    return read_store(cache_path_for(csv_path, STORE_SUFFIX))
+
+
+def read_store(store_path):
+    """Arrow IPC 파일을 메모리 매핑으로 읽기 (데이터 복사 없음)"""
+    with span('data.read_store'):
+        source = pa.memory_map(str(store_path), 'r')
+        return pa.ipc.open_file(source).read_all()
+
+
+def _column_values(column):
+    """null 없는 숫자/시간 컬럼은 매핑된 메모리를 그대로 보는 numpy 뷰, 나머지는 변환"""
+    if (column.num_chunks == 1 and column.null_count == 0
+            and pa.types.is_primitive(column.type)
+            and not pa.types.is_boolean(column.type)):
+        return column.chunk(0).to_numpy(zero_copy_only=True)
+    return column.to_pandas().array
+
+
+def _is_numeric(arrow_type):
+    """select_dtypes(include=[np.number])와 같은 기준 (bool 제외)"""
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def store_to_frame(table, columns=None, numeric_only=False):
+    """메모리 매핑된 테이블에서 필요한 컬럼만 골라 DataFrame 뷰로 구성"""
+    index_name = table.schema.metadata[INDEX_KEY].decode()
+    index = pd.Index(_column_values(table.column(index_name)), name=index_name)
+    if index_name == '__index__':
+        index.name = None
+
+    if columns is None:
+        columns = [
+            field.name for field in table.schema
+            if field.name != index_name and (not numeric_only or _is_numeric(field.type))
+        ]
+    return pd.DataFrame(
+        {name: pd.Series(_column_values(table.column(name)), index=index, copy=False)
+         for name in columns},
+        copy=False
+    )
+
+
+@tracked_cache
+def load_df(cluster_n, columns=None, numeric_only=False):
+    """클러스터 데이터에서 필요한 컬럼만 불러오기 (읽기 전용, 세션 간 공유)
+
+    columns: 필요한 컬럼 이름 튜플 (None이면 전체)
+    numeric_only: columns가 None일 때 숫자 컬럼만 선택
+    Arrow 저장소가 최신이면 메모리 매핑 뷰를 돌려주고, 아니면 Parquet/CSV로 대체합니다.
+    """
+    table = open_cluster_store(cluster_n)
+    if table is not None:
+        return store_to_frame(table, columns, numeric_only)
+
+    file_path = cluster_csv_path(cluster_n)
+    try:
+        df = read_table(file_path, CLUSTER_READ_OPTIONS)
+    except FileNotFoundError:
+        st.error(f"데이터 파일을 찾을 수 없습니다: {file_path}")
+        return None
+    if columns is not None:
+        return df[list(columns)]
+    if numeric_only:
+        return df.select_dtypes(include=[np.number])
+    return df
+
+
+# =============================================================================
+# 7. 공유 메모리 데이터 플레인 (한 호스트의 서버 프로세스들이 /dev/shm의 Arrow 파일 공유)
+# =============================================================================
+# 환경변수 SHARED_DATA_DIR=/dev/shm/ive 처럼 지정하면 켜짐 (없으면 프로세스별 로드)
+MAPPING_STORE_NAME = 'ive_label_cluster'
+
+
+def shared_data_dir():
+    """공유 모드 폴더 (환경변수가 없거나 pyarrow가 없으면 None)"""
+    path = os.environ.get(SHARED_DIR_ENV)
+    if not path or pa is None:
+        return None
+    return Path(path)
+
+
+@contextmanager
+def _publish_lock(store_path):
+    """같은 파일을 여러 프로세스가 동시에 만들지 않도록 파일 잠금
+
+    fcntl이 없는 환경(Windows)에서는 잠금 없이 진행합니다. 파일은 교체 방식으로 쓰므로
+    각자 만들어도 결과는 같고 중복 작업만 생깁니다.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(store_path.with_name(store_path.name + '.lock'), 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def attach_store(store_path, source_path):
+    """공유 폴더의 Arrow 파일을 메모리 매핑으로 열기 (없거나 원본이 바뀌었으면 None)"""
+    if not store_path.exists():
+        return None
+    try:
+        table = read_store(store_path)
+    except (OSError, pa.ArrowException):
+        return None
+    if (table.schema.metadata or {}).get(SIGNATURE_KEY) != source_signature(source_path):
+        return None
+    return table
+
+
+def publish_store(store_path, source_path, build_frame):
+    """최신 파일이 이미 올라와 있으면 붙고, 없으면 잠금을 잡고 한 번만 만들어 올림
+
+    build_frame() → 올릴 DataFrame (원본을 읽고 정리하는 비용은 호스트당 한 번만 듦)
+    원본이 만드는 도중에 바뀌면 None → 호출한 쪽은 프로세스별 로드로 대체합니다.
+    """
+    table = attach_store(store_path, source_path)
+    if table is not None:
+        return table
+
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    with _publish_lock(store_path):
+        table = attach_store(store_path, source_path)
+        if table is None:
+            signature = source_signature(source_path)
+            write_ipc_file(_store_table(build_frame(), signature), store_path)
+            table = attach_store(store_path, source_path)
+    return table
+
+
+def shared_mapping_table(shared_dir):
+    """정리된 매핑 표를 공유 폴더에 올리거나 붙기"""
+    return publish_store(Path(shared_dir) / f'{MAPPING_STORE_NAME}{STORE_SUFFIX}', DATA_PATH, normalized_mapping)
+
+
+def shared_cluster_table(cluster_n, shared_dir):
+    """클러스터 데이터를 공유 폴더에 올리거나 붙기 (디스크의 최신 Arrow 저장소가 있으면 CSV 파싱 생략)"""
+    csv_path = cluster_csv_path(cluster_n)
+
+    def build_frame():
+        if is_cache_fresh(csv_path, STORE_SUFFIX):
+            return store_to_frame(read_store(cache_path_for(csv_path, STORE_SUFFIX)))
+        return read_table(csv_path, CLUSTER_READ_OPTIONS)
+
+    return publish_store(Path(shared_dir) / csv_path.with_suffix(STORE_SUFFIX).name, csv_path, build_frame)
+
+
+def publish_shared_data(shared_dir):
+    """매핑 표와 data 폴더의 모든 클러스터를 공유 폴더에 미리 올리기 (배포 스크립트용)
+
+    올리는 원본은 앱이 읽는 경로(DATA_PATH, cluster_csv_path)와 같아야
+    서버 프로세스가 원본 서명을 비교해 그대로 붙을 수 있습니다.
+    """
+    published = []
+    if os.path.exists(DATA_PATH) and shared_mapping_table(shared_dir) is not None:
+        published.append(MAPPING_STORE_NAME)
+    for csv_path in sorted(DATA_DIR.glob('ive_cluster_*.csv')):
+        cluster_n = int(csv_path.stem.rsplit('_', 1)[-1])
+        if shared_cluster_table(cluster_n, shared_dir) is not None:
+            published.append(csv_path.stem)
+    return published
@@ -0,0 +1,80 @@
+# =============================================================================
+# CVR/CPA 동시 예측 래퍼
+# =============================================================================
+
+import numpy as np
+import pickle
+
+
+# =============================================================================
+# 1. 설정
+# =============================================================================
+# 모델 딕셔너리의 키 순서 = 예측 결과 배열의 행 순서
+TARGETS = ('CVR', 'CPA')
+
+
+# =============================================================================
+# 2. 공통 전처리 분리
+# =============================================================================
+def _split_shared_pipeline(model):
+    """CVR/CPA 파이프라인의 전처리 단계가 완전히 같으면 (전처리, [최종 모델들]) 반환
+
+    전처리가 다르거나 Pipeline이 아니면 (None, None) → 타깃별로 따로 예측
+    """
+    pipelines = [model[target] for target in TARGETS]
+    if not all(len(getattr(p, 'steps', ())) > 1 for p in pipelines):
+        return None, None
+
+    heads = [p[:-1] for p in pipelines]
+    if len({pickle.dumps(head) for head in heads}) != 1:
+        return None, None
+    return heads[0], [p[-1] for p in pipelines]
+
+
+# =============================================================================
+# 3. 예측 래퍼
+# =============================================================================
+class ClusterPredictor:
+    """클러스터 모델({'CVR': ..., 'CPA': ...})을 감싸서 두 타깃을 한 번에 예측
+
+    특성 행렬(ads_shape, mda_idx, ads_time) 인코딩은 한 번만 하고,
+    결과는 미리 잡아 둔 (2, n) 배열에 쓴 뒤 expm1 역변환도 그 자리에서 적용합니다.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.shared_steps, self.estimators = _split_shared_pipeline(model)
+
+    def predict(self, X, out=None):
+        """X의 각 행에 대한 [CVR, CPA] 예측값 (로그 역변환 적용, shape=(2, len(X)))"""
+        if out is None:
+            out = np.empty((len(TARGETS), len(X)))
+
+        if self.shared_steps is not None:
+            encoded = self.shared_steps.transform(X)
+            for row, estimator in enumerate(self.estimators):
+                out[row] = estimator.predict(encoded)
+        else:
+            for row, target in enumerate(TARGETS):
+                out[row] = self.model[target].predict(X)
+
+        np.expm1(out, out=out)
+        return out
+
+
+def predict_many(clusters):
+    """여러 클러스터를 한 번에 예측
+
+    clusters: {클러스터 번호: (ClusterPredictor, X)}
+    반환: {클러스터 번호: (2, len(X)) 예측 배열} — 전부 하나의 버퍼를 나눠 쓰는 뷰
+    """
+    sizes = {cluster_n: len(X) for cluster_n, (_, X) in clusters.items()}
+    buffer = np.empty((len(TARGETS), sum(sizes.values())))
+
+    results = {}
+    start = 0
+    for cluster_n, (predictor, X) in clusters.items():
+        end = start + sizes[cluster_n]
+        results[cluster_n] = predictor.predict(X, out=buffer[:, start:end])
+        start = end
+    return results
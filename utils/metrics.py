@@ -0,0 +1,265 @@
+# =============================================================================
+# 운영 지표 (구간 소요 시간 / 캐시 적중률 / 캐시 메모리 추정, 관리 페이지용)
+# =============================================================================
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    # Windows에는 resource 모듈이 없음 (최대 메모리는 표시하지 않음)
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+# =============================================================================
+# 1. 설정
+# =============================================================================
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+# 구간별로 분위수 계산에 쓰는 최근 측정값 개수
+SPAN_HISTORY = 500
+# 지표 파일 기본 경로 (환경변수 METRICS_FILE로 변경, {pid}는 프로세스 번호로 바뀜)
+# 서버 프로세스가 여러 개여도 서로의 파일을 덮어쓰지 않도록 프로세스마다 따로 저장
+DEFAULT_METRICS_FILE = str(SCRIPT_DIR / 'metrics.{pid}.json')
+
+_lock = threading.Lock()
+
+
+# =============================================================================
+# 2. 구간 소요 시간
+# =============================================================================
+class SpanStats:
+    """구간 하나의 누적 횟수/합계/최댓값 + 최근 측정값"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.recent = deque(maxlen=SPAN_HISTORY)
+
+    def add(self, elapsed_ms):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.last_ms = elapsed_ms
+        self.recent.append(elapsed_ms)
+
+
+_spans = {}
+
+
+def record_span(name, elapsed_ms):
+    """구간 측정값 하나 기록 (프로세스 공용, 스레드 안전)"""
+    with _lock:
+        _spans.setdefault(name, SpanStats()).add(elapsed_ms)
+
+
+@contextmanager
+def span(name):
+    """with 블록의 소요 시간을 name 구간으로 기록 (예외가 나도 기록)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, (time.perf_counter() - start) * 1000)
+
+
+class PageTimer:
+    """페이지의 번호 섹션별 소요 시간 (section()을 부르면 직전 섹션이 끝난 것으로 기록)
+
+    st.stop()으로 중간에 끝난 rerun은 마지막 섹션과 전체 시간이 기록되지 않습니다.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.started = self.mark = time.perf_counter()
+        self.current = None
+
+    def _close(self, now):
+        if self.current is not None:
+            record_span(f"{self.page}/{self.current}", (now - self.mark) * 1000)
+        self.mark = now
+
+    def section(self, name):
+        """새 섹션 시작"""
+        self._close(time.perf_counter())
+        self.current = name
+
+    def finish(self):
+        """마지막 섹션과 페이지 전체 시간 기록"""
+        now = time.perf_counter()
+        self._close(now)
+        self.current = None
+        record_span(f"{self.page}/전체", (now - self.started) * 1000)
+
+
+def page_timer(page):
+    """페이지 맨 위에서 만들고 섹션마다 section() 호출"""
+    return PageTimer(page)
+
+
+# =============================================================================
+# 3. 캐시 적중/실패 카운터 + 메모리 추정
+# =============================================================================
+class CacheStats:
+    """캐시 함수 하나의 호출/계산 횟수와 항목별 메모리 추정값"""
+
+    def __init__(self):
+        self.calls = 0
+        self.misses = 0
+        self.entry_bytes = {}     # 인자 repr → 결과 크기 추정(bytes)
+
+    @property
+    def hits(self):
+        return self.calls - self.misses
+
+
+_caches = {}
+
+
+def estimate_bytes(obj, _depth=0):
+    """캐시된 값의 메모리 크기 추정 (DataFrame/배열/Arrow 테이블은 데이터 크기, 나머지는 재귀 합)
+
+    메모리 매핑된 데이터도 크기에 포함되므로 실제 프로세스 전용 메모리보다 클 수 있습니다.
+    """
+    if obj is None or _depth > 4:
+        return 0
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if pa is not None and isinstance(obj, pa.Table):
+        return int(obj.nbytes)
+    if isinstance(obj, (str, bytes, int, float, bool)):
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_bytes(key, _depth + 1) + estimate_bytes(value, _depth + 1)
+            for key, value in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_bytes(item, _depth + 1) for item in obj)
+    if hasattr(obj, '__dict__'):
+        return sys.getsizeof(obj) + estimate_bytes(vars(obj), _depth + 1)
+    return sys.getsizeof(obj)
+
+
+def tracked_cache(func):
+    """st.cache_resource + 호출/계산 횟수, 계산 시간, 결과 메모리 추정 기록
+
+    실제 계산(캐시 실패)은 'cache:함수이름' 구간으로도 기록됩니다.
+    캐시 키는 원래 함수(모듈, 이름, 소스)로 만들어지므로 st.cache_resource와 동일합니다.
+    """
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+    stats = _caches.setdefault(name, CacheStats())
+
+    @functools.wraps(func)
+    def compute(*args, **kwargs):
+        with span(f"cache:{name}"):
+            result = func(*args, **kwargs)
+        size = estimate_bytes(result)
+        with _lock:
+            stats.misses += 1
+            stats.entry_bytes[repr((args, sorted(kwargs.items())))] = size
+        return result
+
+    cached = st.cache_resource(compute)
+
+    @functools.wraps(func)
+    def call(*args, **kwargs):
+        with _lock:
+            stats.calls += 1
+        return cached(*args, **kwargs)
+
+    call.clear = cached.clear
+    return call
+
+
+# =============================================================================
+# 4. 조회 및 내보내기
+# =============================================================================
+def span_table():
+    """구간별 횟수/평균/p50/p95/최대/마지막(ms) 표 (이름순)"""
+    with _lock:
+        rows = [(name, stats.count, stats.total_ms, stats.max_ms, stats.last_ms, list(stats.recent))
+                for name, stats in _spans.items()]
+    records = []
+    for name, count, total_ms, max_ms, last_ms, recent in sorted(rows):
+        p50, p95 = np.percentile(recent, (50, 95))
+        records.append({
+            'span': name, 'count': count, 'mean_ms': total_ms / count,
+            'p50_ms': p50, 'p95_ms': p95, 'max_ms': max_ms, 'last_ms': last_ms,
+        })
+    return pd.DataFrame(records, columns=['span', 'count', 'mean_ms', 'p50_ms', 'p95_ms', 'max_ms', 'last_ms'])
+
+
+def cache_table():
+    """캐시 함수별 호출/적중/실패/적중률/항목 수/메모리 추정(MB) 표 (메모리 큰 순)"""
+    with _lock:
+        rows = [(name, stats.calls, stats.hits, stats.misses, len(stats.entry_bytes),
+                 sum(stats.entry_bytes.values()))
+                for name, stats in _caches.items()]
+    df = pd.DataFrame(rows, columns=['cache', 'calls', 'hits', 'misses', 'entries', 'bytes'])
+    df['hit_rate'] = (df['hits'] / df['calls'].where(df['calls'] > 0)).fillna(0.0)
+    df['memory_mb'] = df['bytes'] / (1024 * 1024)
+    return (df.sort_values(['bytes', 'calls'], ascending=False)
+              .drop(columns='bytes')
+              .reset_index(drop=True))
+
+
+def peak_rss_mb():
+    """프로세스 최대 상주 메모리(MB), 알 수 없으면 None (Linux는 KB, macOS는 byte 단위)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def snapshot(extra=None):
+    """지표 전체를 JSON으로 저장할 수 있는 딕셔너리로"""
+    return {
+        'pid': os.getpid(),
+        'timestamp': time.time(),
+        'peak_rss_mb': peak_rss_mb(),
+        'spans': span_table().to_dict(orient='records'),
+        'caches': cache_table().to_dict(orient='records'),
+        **(extra or {}),
+    }
+
+
+def metrics_file():
+    """이 프로세스의 지표 파일 경로 (환경변수 METRICS_FILE, 없으면 프로젝트 폴더의 metrics.<pid>.json)"""
+    return Path(os.environ.get('METRICS_FILE', DEFAULT_METRICS_FILE).format(pid=os.getpid()))
+
+
+def export_metrics(path=None, extra=None):
+    """지표를 JSON 파일로 저장하고 경로 반환 (다른 프로세스가 읽다 만 파일을 보지 않도록 교체 방식)"""
+    path = Path(path or metrics_file())
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(snapshot(extra), ensure_ascii=False, indent=2, default=str),
+                        encoding='utf-8')
+    os.replace(tmp_path, path)
+    return path
+
+
+def reset_spans():
+    """구간 측정값 초기화 (캐시 카운터는 캐시 내용과 맞아야 하므로 유지)"""
+    with _lock:
+        _spans.clear()
@@ -0,0 +1,129 @@
+# =============================================================================
+# 클러스터 모델 레지스트리 (지연 로딩 + LRU 제거 + 메모리 예산)
+# =============================================================================
+
+import mmap
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ModelRegistry:
+    """클러스터 모델을 처음 쓸 때만 불러오고, 메모리 예산을 넘으면 가장 오래 안 쓴 모델부터 제거
+
+    loader(cluster_n) → 모델 (없으면 None)
+    sizer(cluster_n, 모델) → 모델 크기(bytes) 추정값
+    여러 세션(스레드)이 동시에 불러도 안전하도록 잠금을 사용합니다.
+    """
+
+    def __init__(self, loader, sizer, budget_bytes):
+        self.loader = loader
+        self.sizer = sizer
+        self.budget_bytes = budget_bytes
+        self._models = OrderedDict()   # cluster_n → (모델, 크기), 뒤쪽일수록 최근 사용
+        self._lock = threading.Lock()
+        self._loading = {}             # cluster_n → 로딩 중복 방지용 잠금
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def used_bytes(self):
+        return sum(size for _, size in self._models.values())
+
+    def get(self, cluster_n):
+        """모델 반환 (캐시에 없으면 불러와서 등록)
+
+        파일 로딩은 클러스터별 잠금 안에서 하므로, 서로 다른 클러스터는 동시에 불러오고
+        같은 클러스터는 한 번만 불러옵니다.
+        """
+        with self._lock:
+            model = self._lookup(cluster_n)
+            if model is not None:
+                return model
+            key_lock = self._loading.setdefault(cluster_n, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                model = self._lookup(cluster_n)
+                if model is not None:
+                    return model
+                self.misses += 1
+
+            model = self.loader(cluster_n)
+            if model is None:
+                return None
+            size = self.sizer(cluster_n, model)
+
+            with self._lock:
+                self._models[cluster_n] = (model, size)
+                self._evict()
+            return model
+
+    def _lookup(self, cluster_n):
+        """캐시에 있으면 최근 사용으로 표시하고 반환 (잠금 안에서 호출)"""
+        if cluster_n not in self._models:
+            return None
+        self._models.move_to_end(cluster_n)
+        self.hits += 1
+        return self._models[cluster_n][0]
+
+    def _evict(self):
+        """예산을 넘는 동안 가장 오래 안 쓴 모델 제거 (방금 불러온 모델 하나는 남김)"""
+        while len(self._models) > 1 and self.used_bytes > self.budget_bytes:
+            self._models.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    def stats(self):
+        """서버 용량 산정용 통계"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'loaded': len(self._models),
+                'used_bytes': self.used_bytes,
+                'budget_bytes': self.budget_bytes,
+                'models': {cluster_n: size for cluster_n, (_, size) in self._models.items()},
+            }
+
+
+def _is_mapped(array):
+    """배열이 메모리 매핑된 파일 위에 있는지 (np.memmap 또는 그 뷰)"""
+    while isinstance(array, np.ndarray):
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return isinstance(array, mmap.mmap)
+
+
+def heap_bytes(obj, _seen=None, _depth=0):
+    """모델이 프로세스 메모리에 올린 배열 크기 합(bytes)
+
+    sklearn 추정기/Pipeline의 속성을 따라가며 numpy 배열 크기를 더합니다.
+    메모리 매핑된 배열은 페이지 캐시를 다른 프로세스와 나눠 쓰고 커널이 언제든 내보낼 수 있으므로
+    예산에 넣지 않습니다 (.joblib 모델은 거의 0, .pkl 모델은 배열 전체).
+    """
+    if _seen is None:
+        _seen = set()
+    if obj is None or _depth > 8 or id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        if _is_mapped(obj):
+            return 0
+        if obj.dtype == object:
+            return int(obj.nbytes) + sum(heap_bytes(item, _seen, _depth + 1) for item in obj.flat)
+        return int(obj.nbytes)
+    if isinstance(obj, dict):
+        return sum(heap_bytes(value, _seen, _depth + 1) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(heap_bytes(item, _seen, _depth + 1) for item in obj)
+    if hasattr(obj, '__dict__'):
+        return heap_bytes(vars(obj), _seen, _depth + 1)
+    return 0
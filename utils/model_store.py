@@ -0,0 +1,100 @@
+# =============================================================================
+# 메모리 매핑용 모델 파일 (.pkl → 비압축 joblib, 여러 서버 프로세스가 물리 메모리 공유)
+# =============================================================================
+
+import pickle
+from pathlib import Path
+
+from utils.data_loader import _replace_atomically, source_signature
+
+try:
+    # scikit-learn과 같이 설치됨 (없으면 항상 .pkl로 읽음)
+    import joblib
+except ImportError:
+    joblib = None
+
+
+# =============================================================================
+# 1. 설정
+# =============================================================================
+STORE_SUFFIX = '.joblib'
+SIGNATURE_FIELD = 'source_signature'
+MODEL_FIELD = 'model'
+
+
+def store_path_for(pkl_path):
+    """.pkl 옆에 저장되는 메모리 매핑용 모델 파일 경로"""
+    return Path(pkl_path).with_suffix(STORE_SUFFIX)
+
+
+def signature_path_for(pkl_path):
+    """변환할 때의 .pkl 서명만 따로 적어 둔 파일 (모델을 열지 않고 최신인지 확인용)"""
+    store_path = store_path_for(pkl_path)
+    return store_path.with_name(store_path.name + '.sig')
+
+
+# =============================================================================
+# 2. 변환
+# =============================================================================
+def write_model_store(pkl_path):
+    """.pkl 모델을 비압축 joblib 파일로 변환
+
+    joblib은 모델 안의 numpy 배열(계수, 트리 노드, 인코더 범주 등)을 피클 본문과 분리해
+    정렬된 원시 버퍼로 저장하므로, mmap_mode='r'로 열면 배열을 복사 없이 매핑합니다.
+    원본 .pkl 서명을 같이 저장해서, 모델이 바뀌면 다시 변환할 때까지 .pkl을 읽습니다.
+    서명은 .sig 파일에도 적어 두어 변환 도구가 모델을 불러오지 않고 건너뛸 수 있게 합니다.
+    """
+    if joblib is None:
+        raise ImportError("모델 파일을 변환하려면 joblib(scikit-learn 설치 시 포함)이 필요합니다.")
+    pkl_path = Path(pkl_path)
+    signature = source_signature(pkl_path)
+    with open(pkl_path, 'rb') as f:
+        model = pickle.load(f)
+
+    store_path = _replace_atomically(
+        store_path_for(pkl_path),
+        lambda path: joblib.dump({SIGNATURE_FIELD: signature, MODEL_FIELD: model}, path, compress=0)
+    )
+    # 모델 파일을 먼저 바꾼 뒤 서명을 적으므로, 중간에 멈추면 다음 변환 때 다시 만듦
+    _replace_atomically(signature_path_for(pkl_path), lambda path: path.write_bytes(signature))
+    return store_path
+
+
+def is_store_fresh(pkl_path):
+    """메모리 매핑용 파일이 있고 현재 .pkl로부터 만들어진 것인지 확인 (.sig 파일만 읽음)"""
+    try:
+        return (store_path_for(pkl_path).exists()
+                and signature_path_for(pkl_path).read_bytes() == source_signature(pkl_path))
+    except OSError:
+        return False
+
+
+def build_model_store(model_dir, force=False):
+    """model 폴더의 모든 ive_model_cluster_N.pkl 변환 (최신 파일은 건너뜀)"""
+    written = []
+    for pkl_path in sorted(Path(model_dir).glob('ive_model_cluster_*.pkl')):
+        if force or not is_store_fresh(pkl_path):
+            written.append(write_model_store(pkl_path))
+    return written
+
+
+# =============================================================================
+# 3. 읽기
+# =============================================================================
+def read_model_store(pkl_path):
+    """최신 joblib 모델을 메모리 매핑으로 열기 (없거나 .pkl이 바뀌었으면 None)
+
+    배열은 읽기 전용 np.memmap이라 OS 페이지 캐시에 한 벌만 올라가고,
+    같은 파일을 여는 프로세스끼리 그 페이지를 공유합니다.
+    """
+    store_path = store_path_for(pkl_path)
+    if joblib is None or not store_path.exists():
+        return None
+    try:
+        stored = joblib.load(store_path, mmap_mode='r')
+        signature = source_signature(pkl_path)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        return None
+    if not isinstance(stored, dict) or stored.get(SIGNATURE_FIELD) != signature:
+        return None
+    return stored[MODEL_FIELD]
@@ -0,0 +1,261 @@
+# =============================================================================
+# 광고 추천 계산 (TOP_3.py 공용 / 오프라인 배치 공용)
+# =============================================================================
+
+import streamlit as st
+import numpy as np
+import os
+import pickle
+
+from utils.data_loader import (
+    DATA_ROOT, SIGNATURE_KEY, _replace_atomically, _to_arrow, cluster_csv_path, source_signature, load_df,
+)
+from utils.inference import ClusterPredictor, predict_many
+from utils.model_registry import ModelRegistry, heap_bytes
+from utils.model_store import read_model_store
+from utils.metrics import span, tracked_cache
+
+try:
+    # pip install pyarrow 필요 (없으면 항상 실시간 계산)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+# =============================================================================
+# 1. 경로 및 설정
+# =============================================================================
+MODEL_DIR = DATA_ROOT / "model"
+FEATURE_COLUMNS = ('ads_shape', 'mda_idx', 'ads_time')
+MIN_DATA_COUNT = 20
+TOP_K = 10
+DEFAULT_MODEL_BUDGET_MB = 512
+
+
+def model_path(cluster_n):
+    """클러스터 모델 파일 경로"""
+    return MODEL_DIR / f'ive_model_cluster_{cluster_n}.pkl'
+
+
+def recommendation_path(cluster_n):
+    """클러스터 추천표(미리 계산된 TOP 10) 파일 경로"""
+    return MODEL_DIR / f'ive_reco_cluster_{cluster_n}.parquet'
+
+
+# =============================================================================
+# 2. 추천 계산
+# =============================================================================
+def top_k_positions(scores, k):
+    """점수 상위 k개의 위치를 내림차순으로 반환
+
+    전체 정렬 대신 argpartition으로 O(n) 부분 선택 후 후보 k개만 정렬합니다.
+    NaN은 가장 낮은 점수로 보고, 같은 점수는 원래 순서가 앞선 행이 우선입니다.
+    """
+    keys = -np.asarray(scores, dtype=float)
+    keys[np.isnan(keys)] = np.inf
+    n = len(keys)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    if k < n:
+        # k번째 값과 같은 점수의 행까지 후보로 넣어야 동점 처리가 정렬과 같아짐
+        kth_key = np.partition(keys, k - 1)[k - 1]
+        candidates = np.flatnonzero(keys <= kth_key)
+    else:
+        candidates = np.arange(n)
+    order = np.lexsort((candidates, keys[candidates]))
+    return candidates[order[:k]]
+
+
+def robust_scale(values):
+    """sklearn RobustScaler 기본 설정과 같은 열별 스케일링: (x - 중앙값) / IQR(25~75%)
+
+    IQR이 0에 가까운 열은 1로 나눕니다 (sklearn과 같은 기준). NaN은 통계 계산에서 제외.
+    """
+    values = np.asarray(values, dtype=float)
+    center = np.nanmedian(values, axis=0)
+    q_min, q_max = np.nanpercentile(values, (25.0, 75.0), axis=0)
+    scale = q_max - q_min
+    scale[scale < 10 * np.finfo(scale.dtype).eps] = 1.0
+    return (values - center) / scale
+
+
+def unique_conditions(df):
+    """(고유 조합 DataFrame, 조합별 행 수) — 개수 집계 한 번으로 같이 얻음 (등장 순서 유지)"""
+    counts = df.groupby(list(FEATURE_COLUMNS), sort=False).size()
+    return counts.index.to_frame(index=False), counts.to_numpy()
+
+
+def rank_conditions(conditions, data_count, predictions, k=TOP_K):
+    """조합별 [CVR, CPA] 예측값으로 효율 점수 상위 k개 반환
+
+    광고 효율 점수 = CVR_scaled + (1 - CPA_scaled), 데이터가 MIN_DATA_COUNT개 미만인 조합은 제외
+    """
+    pred_cvr, pred_cpa = predictions
+    result_df = conditions
+    result_df['Pred_CVR'] = pred_cvr
+    result_df['Pred_CPA'] = pred_cpa
+    result_df['Data_Count'] = data_count
+    result_df = result_df[result_df['Data_Count'] >= MIN_DATA_COUNT].copy()
+    scaled_vals = robust_scale(result_df[['Pred_CVR', 'Pred_CPA']].to_numpy())
+    result_df['CVR_scaled'] = scaled_vals[:, 0]
+    result_df['CPA_scaled'] = scaled_vals[:, 1]
+    result_df['score'] = result_df['CVR_scaled'] + (1 - result_df['CPA_scaled'])
+    top_k = result_df.iloc[top_k_positions(result_df['score'].to_numpy(), k)].copy()
+    # 화면 표시는 매체 번호를 문자열로 (상위 k개만 변환)
+    top_k['mda_idx'] = top_k['mda_idx'].astype(str)
+    return top_k
+
+
+def predict_top(df, model, k=TOP_K):
+    """조건 조합별 CVR/CPA를 예측하고 효율 점수 상위 k개 반환 (model: 모델 딕셔너리 또는 ClusterPredictor)"""
+    if not isinstance(model, ClusterPredictor):
+        model = ClusterPredictor(model)
+    conditions, data_count = unique_conditions(df)
+    with span('model.predict'):
+        predictions = model.predict(conditions)
+    return rank_conditions(conditions, data_count, predictions, k)
+
+
+def split_top3(top_k):
+    """상위 k개 표에서 TOP 1/2/3 행과 TOP 3 표를 분리"""
+    top = top_k.head(3).copy()
+    top['rank_label'] = range(1, len(top) + 1)
+    top1 = top.iloc[[0]].reset_index(drop=True)
+    top2 = top.iloc[[1]].reset_index(drop=True)
+    top3 = top.iloc[[2]].reset_index(drop=True)
+    return top1, top2, top3, top
+
+
+# =============================================================================
+# 3. 모델 로드 및 실시간 추천 캐시
+# =============================================================================
+def load_model(cluster_n):
+    """클러스터 CVR/CPA 모델 파일 불러오기 (캐시 없음, 레지스트리/배치 작업에서 사용)
+
+    tools.build_model_store로 만든 최신 .joblib 파일이 있으면 배열을 메모리 매핑으로 열고,
+    없으면 .pkl 전체를 읽습니다.
+    """
+    file_path = model_path(cluster_n)
+    with span('model.load_mmap'):
+        model = read_model_store(file_path)
+    if model is not None:
+        return model
+    try:
+        with open(file_path, "rb") as f, span('model.load'):
+            return pickle.load(f)
+    except FileNotFoundError:
+        st.error(f"모델 파일을 찾을 수 없습니다: {file_path}")
+        return None
+
+
+def _load_predictor_uncached(cluster_n):
+    model = load_model(cluster_n)
+    if model is None:
+        return None
+    return ClusterPredictor(model)
+
+
+def _model_size(cluster_n, predictor):
+    """모델 메모리 크기 추정: 메모리에 올라간 배열 크기 (메모리 매핑된 .joblib 배열은 제외)"""
+    return heap_bytes(predictor.model)
+
+
+@tracked_cache
+def get_model_registry():
+    """프로세스 공용 모델 레지스트리 (예산: 환경변수 MODEL_MEMORY_BUDGET_MB, 기본 512MB)"""
+    budget_mb = float(os.environ.get('MODEL_MEMORY_BUDGET_MB', DEFAULT_MODEL_BUDGET_MB))
+    return ModelRegistry(_load_predictor_uncached, _model_size, int(budget_mb * 1024 * 1024))
+
+
+def load_predictor(cluster_n):
+    """클러스터 모델을 CVR/CPA 동시 예측 래퍼로 감싸서 반환 (레지스트리 경유)"""
+    return get_model_registry().get(cluster_n)
+
+
+@tracked_cache
+def cluster_fingerprint(cluster_n):
+    """모델 + 데이터 버전 지문 (프로세스당 한 번만 계산)"""
+    return _recommendation_signature(cluster_n)
+
+
+@tracked_cache
+def recommend_cluster(cluster_n, fingerprint):
+    """실시간 추천 계산, 캐시 키는 (클러스터 번호, 버전 지문)뿐이라 DataFrame 해싱이 없음"""
+    predictor = load_predictor(cluster_n)
+    df = load_df(cluster_n, columns=FEATURE_COLUMNS)
+    return predict_top(df, predictor)
+
+
+def get_recommendation(cluster_n):
+    """미리 계산된 추천표가 있으면 조회, 없으면 실시간 계산 결과(캐시) 반환"""
+    top_k = load_recommendation(cluster_n)
+    if top_k is None:
+        top_k = recommend_cluster(cluster_n, cluster_fingerprint(cluster_n))
+    return top_k
+
+
+# =============================================================================
+# 4. 미리 계산된 추천표 (오프라인 배치 → 페이지에서는 조회만)
+# =============================================================================
+def _recommendation_signature(cluster_n):
+    """모델 파일 + 클러스터 CSV 서명, 둘 중 하나라도 바뀌면 추천표는 무효"""
+    return source_signature(model_path(cluster_n)) + b'|' + source_signature(cluster_csv_path(cluster_n))
+
+
+def _save_recommendation(cluster_n, top_k, signature):
+    """추천표를 원본 서명과 함께 Parquet로 저장 (signature는 계산 전에 잰 값)"""
+    if pq is None:
+        raise ImportError("추천표를 저장하려면 pyarrow가 필요합니다.")
+    table = _to_arrow(top_k, signature)
+    return _replace_atomically(recommendation_path(cluster_n), lambda path: pq.write_table(table, path))
+
+
+def write_recommendation(cluster_n, k=TOP_K):
+    """클러스터 하나의 추천 파이프라인을 실행해 상위 k개 표를 Parquet로 저장"""
+    signature = _recommendation_signature(cluster_n)
+    model = load_model(cluster_n)
+    df = load_df(cluster_n, columns=FEATURE_COLUMNS)
+    return _save_recommendation(cluster_n, predict_top(df, model, k), signature)
+
+
+def build_recommendations(k=TOP_K):
+    """model 폴더의 모든 ive_model_cluster_N.pkl에 대해 추천표 생성
+
+    모든 클러스터의 고유 조합을 predict_many 한 번으로 예측합니다 (결과는 버퍼 하나를 나눠 씀).
+    """
+    if pq is None:
+        raise ImportError("추천표를 저장하려면 pyarrow가 필요합니다.")
+    clusters = sorted(int(path.stem.rsplit('_', 1)[-1]) for path in MODEL_DIR.glob('ive_model_cluster_*.pkl'))
+    signatures = {cluster_n: _recommendation_signature(cluster_n) for cluster_n in clusters}
+    inputs = {}
+    for cluster_n in clusters:
+        conditions, data_count = unique_conditions(load_df(cluster_n, columns=FEATURE_COLUMNS))
+        inputs[cluster_n] = (ClusterPredictor(load_model(cluster_n)), conditions, data_count)
+
+    with span('model.predict'):
+        predictions = predict_many({cluster_n: (predictor, conditions)
+                                    for cluster_n, (predictor, conditions, _) in inputs.items()})
+    return [
+        _save_recommendation(cluster_n, rank_conditions(conditions, data_count, predictions[cluster_n], k),
+                             signatures[cluster_n])
+        for cluster_n, (_, conditions, data_count) in inputs.items()
+    ]
+
+
+@tracked_cache
+def load_recommendation(cluster_n):
+    """미리 계산된 추천표 조회 (없거나 모델/데이터가 바뀌었으면 None)"""
+    path = recommendation_path(cluster_n)
+    if pq is None or not path.exists():
+        return None
+    try:
+        table = pq.read_table(path)
+        signature = _recommendation_signature(cluster_n)
+    except (OSError, pa.ArrowException):
+        return None
+    if (table.schema.metadata or {}).get(SIGNATURE_KEY) != signature:
+        return None
+    return table.to_pandas()
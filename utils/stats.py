@@ -0,0 +1,162 @@
+# =============================================================================
+# 클러스터 요약 통계 (home.py의 KPI / 기술 통계 / 상관관계 / 구성 차트 공용)
+# =============================================================================
+
+import warnings
+
+import pandas as pd
+import numpy as np
+
+from utils.data_loader import load_mapping_data, load_df
+from utils.metrics import tracked_cache
+
+
+# =============================================================================
+# 1. 설정
+# =============================================================================
+# describe()와 같은 행 순서 (min/max는 0%/100% 분위수로 같이 계산)
+DESCRIBE_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+QUANTILES = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+
+# =============================================================================
+# 2. 통계 객체
+# =============================================================================
+def _quantiles(values):
+    """결측 없는 2차원 배열의 열별 분위수 (np.quantile 기본값 linear와 같은 결과)
+
+    필요한 순위만 한 번의 np.partition으로 고정해서 전체 정렬을 피합니다.
+    """
+    positions = np.asarray(QUANTILES) * (len(values) - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    partitioned = np.partition(values, np.unique(np.r_[lower, upper]), axis=0)
+    below, above = partitioned[lower], partitioned[upper]
+    diff = above - below
+    weight = (positions - lower)[:, None]
+    # numpy와 같은 보간식 (가중치가 0.5 이상이면 위쪽 값 기준)
+    return np.where(weight >= 0.5, above - diff * (1 - weight), below + diff * weight)
+
+
+class ClusterStats:
+    """숫자 컬럼의 개수/평균/표준편차/분위수/상관행렬을 한 번에 계산해 보관
+
+    describe() / corr() 결과는 pandas와 같은 모양의 DataFrame으로 미리 만들어 두므로
+    페이지에서는 조회만 합니다 (읽기 전용으로 다룰 것).
+    """
+
+    def __init__(self, df):
+        columns = list(df.columns)
+        # 컬럼 단위로 연속된 배열이어야 열별 합계가 pandas와 같은 순서로 더해짐
+        values = np.asfortranarray(df.to_numpy(dtype=float))
+        n_rows = len(values)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if n_rows and not np.isnan(values).any():
+                count = np.full(len(columns), n_rows, dtype=float)
+                mean = values.mean(axis=0)
+                centered = values - mean
+                cov = centered.T @ centered / (n_rows - 1)
+                std = np.sqrt(np.diag(cov))
+                corr = np.clip(cov / np.outer(std, std), -1, 1)
+                quantiles = _quantiles(values)
+                corr_df = pd.DataFrame(corr, index=columns, columns=columns)
+            else:
+                # 결측이 있으면 컬럼별로 건너뛰고, 상관은 pandas의 쌍별(pairwise) 계산 사용
+                count = (~np.isnan(values)).sum(axis=0).astype(float)
+                # 전부 결측인 컬럼은 NaN이 정상 결과 (nan* 함수의 RuntimeWarning은 errstate로 안 막힘)
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    mean = np.nanmean(values, axis=0) if n_rows else np.full(len(columns), np.nan)
+                    std = np.nanstd(values, axis=0, ddof=1) if n_rows else np.full(len(columns), np.nan)
+                    quantiles = (np.nanquantile(values, QUANTILES, axis=0) if n_rows
+                                 else np.full((len(QUANTILES), len(columns)), np.nan))
+                corr_df = df.corr()
+
+        self.columns = columns
+        self.count = pd.Series(count, index=columns)
+        self.mean = pd.Series(mean, index=columns)
+        self.describe = pd.DataFrame(
+            np.vstack([count, mean, std, quantiles[0], quantiles[1], quantiles[2], quantiles[3], quantiles[4]]),
+            index=DESCRIBE_INDEX, columns=columns
+        )
+        self.corr = corr_df
+
+    @property
+    def empty(self):
+        """데이터가 한 행도 없으면 True (filtered_df.empty와 같은 의미)"""
+        return not self.columns or self.count.max() == 0
+
+
+# =============================================================================
+# 3. 캐시된 통계 조회
+# =============================================================================
+@tracked_cache
+def load_cluster_stats(cluster_n):
+    """클러스터 숫자 컬럼의 요약 통계 (프로세스당 클러스터별 한 번만 계산)"""
+    df = load_df(cluster_n, numeric_only=True)
+    if df is None:
+        return None
+    return ClusterStats(df)
+
+
+# =============================================================================
+# 4. 클러스터 구성 분포 (산업군 / OS / 분기 빈도, home.py 차트용)
+# =============================================================================
+# (카테고리 이름, 매핑 컬럼) - 차트의 막대 순서
+COMPOSITION_COLUMNS = (('산업군', 'ads_industry'), ('OS', 'ads_os_type'), ('분기', 'quarter_conv'))
+
+
+def to_quarter(months):
+    """'1월'/'7' 같은 월 값을 'nQ' 분기로 변환 (숫자로 못 읽는 값은 그대로 둠, 벡터 연산)"""
+    digits = months.astype(str).str.replace('월', '', regex=False)
+    number = pd.to_numeric(digits.where(digits.str.fullmatch(r'\s*[+-]?\d+\s*')), errors='coerce')
+    quarter = ((number - 1) // 3 + 1).astype('Int64').astype(str) + 'Q'
+    return months.where(number.isna(), quarter)
+
+
+@tracked_cache
+def load_cluster_composition():
+    """전체 클러스터의 구성 빈도표를 한 번에 계산 (인덱스: Cluster / 컬럼: Label, Count, Category)
+
+    클러스터 안에서는 카테고리 순서 → 빈도 내림차순 → 먼저 나온 값 순서로 정렬되어
+    value_counts()를 클러스터마다 따로 돌린 결과와 같습니다.
+    """
+    mapping_df = load_mapping_data()
+    if mapping_df is None:
+        return None
+
+    source = pd.DataFrame({
+        'Cluster': mapping_df['Cluster'],
+        'ads_industry': mapping_df['ads_industry'],
+        'ads_os_type': mapping_df['ads_os_type'],
+        'quarter_conv': to_quarter(mapping_df['ads_month']),
+        'position': np.arange(len(mapping_df)),
+    })
+
+    parts = []
+    for order, (category, column) in enumerate(COMPOSITION_COLUMNS):
+        counts = (source.groupby(['Cluster', column], sort=False)['position']
+                  .agg(['size', 'min'])
+                  .reset_index())
+        parts.append(pd.DataFrame({
+            'Cluster': counts['Cluster'],
+            'Label': counts[column],
+            'Count': counts['size'],
+            'Category': category,
+            'order': order,
+            'first': counts['min'],
+        }))
+
+    composition = pd.concat(parts, ignore_index=True).sort_values(
+        ['Cluster', 'order', 'Count', 'first'], ascending=[True, True, False, True]
+    )
+    return composition.set_index('Cluster')[['Label', 'Count', 'Category']]
+
+
+def cluster_composition(cluster_n):
+    """클러스터 하나의 구성 빈도표 (Label, Count, Category), 없으면 빈 표"""
+    composition = load_cluster_composition()
+    if composition is None or cluster_n not in composition.index:
+        return pd.DataFrame(columns=['Label', 'Count', 'Category'])
+    return composition.loc[[cluster_n]].reset_index(drop=True)
@@ -0,0 +1,231 @@
+# =============================================================================
+# 공통 테마 CSS (메인 스크립트 / 모든 페이지 공용)
+# =============================================================================
+
+import re
+
+import streamlit as st
+
+from utils.assets import FONT_CSS
+from utils.metrics import tracked_cache
+
+
+# =============================================================================
+# 1. 공통 스타일 (여러 페이지가 같이 쓰는 규칙)
+# =============================================================================
+SIDEBAR_CSS = """
+/* 사이드바 실제 컨텐츠 영역 */
+section[data-testid="stSidebar"] > div {
+    background: linear-gradient(
+        230deg,
+        #FFFFFF 0%,
+        #FFF1F2 50%,
+        #E9353E 100%
+    ) !important;
+
+    border-right: 1px solid #E5E7EB;
+}
+
+/* 사이드바 글자 색 */
+section[data-testid="stSidebar"] * {
+    color: #111827;
+}
+"""
+
+CARD_CSS = """
+/* ==============================
+   3D 카드 스타일 (메인 컨테이너용)
+============================== */
+.card-3d {
+    background: #FFFFFF;
+    border-radius: 16px;
+    padding: 20px;
+    width: 100%;
+    box-shadow:
+        0 4px 8px rgba(0,0,0,0.04),
+        0 12px 24px rgba(0,0,0,0.08);
+    border: 1px solid #F1F3F5;
+}
+
+/* ==============================
+   KPI 카드 스타일 (제목/값 크기는 페이지별 스타일에서 지정)
+============================== */
+.kpi-card {
+    background: #FFFFFF;
+    border-radius: 14px;
+    padding: 18px 20px;
+    width: 100%;
+    box-shadow:
+        0 4px 10px rgba(0,0,0,0.05),
+        0 12px 28px rgba(0,0,0,0.08);
+    border: 1px solid #E5E7EB;
+}
+
+.kpi-sub {
+    font-size: 12px;
+    color: #9CA3AF;
+    margin-top: 4px;
+}
+
+.chart-title {
+    font-size: 20px;
+    font-weight: bold;
+    color: #333;
+    margin-bottom: 15px;
+}
+
+/* ==============================
+   Info 카드 (페이지 소개용)
+============================== */
+.info-card {
+    background: #FFFFFF;
+    border-radius: 16px;
+    padding: 22px 24px;
+    width: 100%;
+    box-shadow:
+        0 6px 16px rgba(0,0,0,0.08),
+        0 12px 28px rgba(0,0,0,0.06);
+    border: 1px solid #E5E7EB;
+}
+
+.info-db-card {
+    background: #FFFFFF;
+    border-radius: 16px;
+    padding: 22px 24px;
+    width: 100%;
+    box-shadow:
+        0 6px 16px rgba(0,0,0,0.08),
+        0 12px 28px rgba(0,0,0,0.06);
+    border: 1px solid #E5E7EB;
+    padding-bottom: 28px;
+    padding-top: 28px;
+}
+
+.info-title {
+    font-size: 18px;
+    font-weight: 700;
+    margin-bottom: 6px;
+    color: #111827;
+}
+
+.info-desc {
+    font-size: 14px;
+    color: gray;
+    margin-bottom: 10px;
+}
+
+.info-list {
+    padding-left: 18px;
+    margin: 0;
+}
+
+.info-list li {
+    font-size: 14px;
+    color: #374151;
+    margin-bottom: 6px;
+}
+.info-list li.empty {
+    height: 22px;
+    list-style: none;
+}
+"""
+
+
+# =============================================================================
+# 2. 페이지별 스타일 (같은 클래스라도 페이지마다 값이 다른 규칙만)
+# =============================================================================
+PAGE_CSS = {
+    'home': """
+.kpi-title {
+    font-size: 14px;
+    color: #6B7280;
+    margin-bottom: 6px;
+}
+
+.kpi-value {
+    font-size: 26px;
+    font-weight: 700;
+    color: #111827;
+}
+""",
+    'TOP_3': """
+.kpi-title {
+    font-size: 32px;
+    color: #E85A4F;
+    margin-left: 20px;
+    font-weight: 650;
+    margin-bottom: 15px;
+}
+
+.kpi-sub_title {
+    font-size: 17px;
+    color: #111827;
+    margin-left: 20px;
+}
+
+.kpi-sub_title1 {
+    font-size: 17px;
+    color: #111827;
+    margin-right: 15px;
+    margin-left: 20px;
+}
+
+.kpi-value {
+    font-size: 18px;
+    font-weight: 650;
+    color: #E85A4F;
+}
+""",
+    'information': """
+.kpi-title {
+    font-size: 22px;
+    color: #6B7280;
+    margin-bottom: 6px;
+}
+
+.kpi-value {
+    font-size: 18px;
+    font-weight: 650;
+    color: #111827;
+}
+""",
+}
+
+
+# =============================================================================
+# 3. 압축 및 주입
+# =============================================================================
+def minify_css(css):
+    """주석/줄바꿈/불필요한 공백 제거"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    css = re.sub(r'\(\s+', '(', re.sub(r'\s+\)', ')', css))
+    return css.replace(';}', '}').strip()
+
+
+@tracked_cache
+def theme_stylesheet():
+    """폰트 + 공통 스타일을 합쳐 압축한 <style> 태그 (프로세스당 한 번만 생성)"""
+    return f"<style>{minify_css(FONT_CSS + SIDEBAR_CSS + CARD_CSS)}</style>"
+
+
+@tracked_cache
+def page_stylesheet(page):
+    """페이지별 스타일 <style> 태그"""
+    return f"<style>{minify_css(PAGE_CSS[page])}</style>"
+
+
+def apply_theme():
+    """공통 스타일시트 주입 (메인 스크립트에서 rerun마다 한 번 호출)
+
+    <style>만 있는 st.html은 이벤트 컨테이너로 가서 레이아웃 공간을 차지하지 않고,
+    매번 내용이 같아서 두 번째 rerun부터는 브라우저에 캐시된 메시지의 해시만 전송됩니다
+    (.streamlit/config.toml의 global.minCachedMessageSize).
+    """
+    st.html(theme_stylesheet())
+
+
+def apply_page_style(page):
+    """페이지별 스타일 주입 (각 페이지 맨 위에서 호출)"""
+    st.html(page_stylesheet(page))
@@ -0,0 +1,153 @@
+# =============================================================================
+# 서버 시작 시 캐시 미리 채우기 (데이터 / 모델 / 추천)
+# =============================================================================
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from utils.data_loader import cluster_csv_path, load_mapping_data, load_cluster_index, load_df
+from utils.recommend import FEATURE_COLUMNS, get_recommendation, model_path
+from utils.stats import load_cluster_stats, load_cluster_composition
+from utils.charts import CHART_BUILDERS, load_chart_spec
+from utils.metrics import tracked_cache
+
+
+THREAD_PREFIX = 'warmup'
+SCRIPT_RUN_CONTEXT_LOGGER = 'streamlit.runtime.scriptrunner_utils.script_run_context'
+
+
+class _WarmupThreadFilter(logging.Filter):
+    """워밍업 스레드의 'missing ScriptRunContext' 경고만 거름
+
+    워밍업은 세션 밖에서 캐시를 채우므로 스크립트 컨텍스트가 없는 게 정상입니다.
+    (로그 레벨은 Streamlit이 설정값으로 되돌리므로 레벨 대신 필터 사용)
+    """
+
+    def filter(self, record):
+        return not record.threadName.startswith(THREAD_PREFIX)
+
+
+logging.getLogger(SCRIPT_RUN_CONTEXT_LOGGER).addFilter(_WarmupThreadFilter())
+
+
+# =============================================================================
+# 1. 진행 상황
+# =============================================================================
+class WarmupProgress:
+    """워밍업 진행 상황 (readiness 체크에서 wait() 또는 snapshot() 사용)"""
+
+    def __init__(self):
+        self.total = 0
+        self.done = 0
+        self.failed = {}          # cluster_n → 오류 메시지
+        self.started_at = time.time()
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+    @property
+    def ready(self):
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """워밍업이 끝날 때까지 대기 (끝났으면 True)"""
+        return self._finished.wait(timeout)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'ready': self.ready,
+                'total': self.total,
+                'done': self.done,
+                'failed': dict(self.failed),
+                'elapsed_sec': round((self.finished_at or time.time()) - self.started_at, 3),
+            }
+
+    def _write_status(self):
+        """환경변수 WARMUP_STATUS_FILE이 있으면 진행 상황을 JSON으로 기록 (외부 readiness probe용)"""
+        status_file = os.environ.get('WARMUP_STATUS_FILE')
+        if status_file:
+            # probe가 쓰다 만 JSON을 읽지 않도록 임시 파일에 쓰고 교체
+            tmp_path = f"{status_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f, ensure_ascii=False)
+            os.replace(tmp_path, status_file)
+
+
+# =============================================================================
+# 2. 워밍업 작업
+# =============================================================================
+def list_clusters():
+    """매핑 데이터에 등장하는 모든 클러스터 번호"""
+    mapping_df = load_mapping_data()
+    if mapping_df is None:
+        return []
+    return sorted(int(c) for c in mapping_df['Cluster'].dropna().unique())
+
+
+def warm_cluster(cluster_n):
+    """두 페이지가 쓰는 캐시를 한 클러스터 분량만큼 채움
+
+    모델은 미리 계산된 추천표가 없을 때만 레지스트리로 불러옵니다 (메모리 예산 절약).
+    파일이 없으면 st.error 대신 예외로 알려서 progress.failed에 남깁니다
+    (워밍업 스레드의 st.error는 어느 화면에도 표시되지 않음).
+    """
+    for path in (cluster_csv_path(cluster_n), model_path(cluster_n)):
+        if not path.exists():
+            raise FileNotFoundError(f"파일이 없습니다: {path}")
+    load_cluster_stats(cluster_n)                    # home.py
+    load_df(cluster_n, columns=FEATURE_COLUMNS)      # TOP_3.py
+    get_recommendation(cluster_n)
+    for kind in CHART_BUILDERS:                      # 두 페이지의 차트 스펙
+        load_chart_spec(kind, cluster_n)
+
+
+def _run(progress, max_workers):
+    try:
+        load_cluster_index()
+        load_cluster_composition()                   # home.py 차트
+        clusters = list_clusters()
+        with progress._lock:
+            progress.total = len(clusters)
+        progress._write_status()
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=THREAD_PREFIX) as pool:
+            futures = {pool.submit(warm_cluster, cluster_n): cluster_n for cluster_n in clusters}
+            for future in as_completed(futures):
+                error = future.exception()
+                with progress._lock:
+                    progress.done += 1
+                    if error is not None:
+                        progress.failed[futures[future]] = repr(error)
+                progress._write_status()
+    finally:
+        # 매핑 데이터 로드 자체가 실패해도 readiness 체크가 무한 대기하지 않도록 종료 표시
+        progress.finished_at = time.time()
+        progress._finished.set()
+        progress._write_status()
+
+
+def default_workers():
+    """워밍업 스레드 수 (환경변수 WARMUP_WORKERS, 기본 최대 4)"""
+    return int(os.environ.get('WARMUP_WORKERS', min(4, os.cpu_count() or 1)))
+
+
+def run_warmup(max_workers=None):
+    """현재 스레드에서 워밍업을 끝까지 실행 (세션 없이 돌리는 tools.warmup용)"""
+    progress = WarmupProgress()
+    _run(progress, max_workers or default_workers())
+    return progress
+
+
+@tracked_cache
+def start_warmup(max_workers=None):
+    """프로세스당 한 번만 백그라운드 워밍업 시작 (요청 처리를 막지 않음)"""
+    if max_workers is None:
+        max_workers = default_workers()
+    progress = WarmupProgress()
+    threading.Thread(target=_run, args=(progress, max_workers), name=THREAD_PREFIX, daemon=True).start()
+    return progress
@@ -1,8 +1,8 @@
 import streamlit as st
-import base64
-from io import BytesIO
-from PIL import Image # pip install Pillow 필요
 from pathlib import Path
+from utils.assets import cursor_css, find_image
+from utils.theme import apply_theme
+from utils.warmup import start_warmup
 
 # =========================================================
 # 1. 파일 지정
@@ -12,113 +12,31 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 
 # 1.2. 커서 파일 지정
 IMAGE_DIR = SCRIPT_DIR / "image"
-cursor_path = IMAGE_DIR / "찐막.png"
+cursor_name = "찐막.png"
 target_size = 90
 
 
 # =========================================================
-# 2. 이미지 처리 함수 (PNG 리사이징 및 Base64 변환)
-# =========================================================
-def get_resized_png_b64(filename, new_width):   
-    """PNG 파일을 열어서 크기를 조절하고 Base64 문자열로 반환"""
-    with open(filename, 'rb') as f:
-        img = Image.open(f)
-        
-        # 혹시 모를 호환성 문제 방지를 위해 RGBA(투명 배경 지원) 모드로 변환
-        img = img.convert("RGBA")
-
-        # 이미지 비율 유지하며 리사이징 크기 계산
-        w_percent = (new_width / float(img.size[0]))
-        h_size = int((float(img.size[1]) * float(w_percent)))
-        
-        # 고품질 리사이징 (LANCZOS 필터 사용)
-        resized_img = img.resize((new_width, h_size), Image.Resampling.LANCZOS)
-        
-        # 메모리 버퍼에 PNG 형식으로 저장
-        buffer = BytesIO()
-        resized_img.save(buffer, format="PNG")
-        
-        # Base64로 인코딩해서 문자열로 반환
-        return base64.b64encode(buffer.getvalue()).decode()
-
-
-# =========================================================
-# 3. 커서 CSS 적용 실행
+# 2. 커서 CSS 적용 실행
 # =========================================================
 try:
-    # 함수를 실행해 리사이징된 이미지의 Base64 코드를 받습니다.
-    cursor_b64 = get_resized_png_b64(cursor_path, target_size)
+    # 한글 파일명이 NFC/NFD 어느 쪽으로 저장돼 있어도 찾도록 find_image 사용
+    cursor_path = find_image(cursor_name, IMAGE_DIR)
 
-    hotspot_x = 0
-    hotspot_y = 0
-    
-    cursor_css_value = f'url("data:image/png;base64,{cursor_b64}") {hotspot_x} {hotspot_y}, auto !important'
-
-    st.markdown(f"""
-    <style>
-    /* 전체 페이지 적용 */
-    * {{
-        cursor: {cursor_css_value};
-    }}
-    
-    /* 사이드바 영역 강제 적용 */
-    section[data-testid="stSidebar"] * {{
-        cursor: {cursor_css_value};
-    }}
-    
-    /* 버튼, 입력창 등 인터랙티브 요소 강제 적용 */
-    button, select, input, textarea, label, a, div[data-testid="stMetricValue"] {{
-        cursor: {cursor_css_value};
-    }}
-    </style>
-    """, unsafe_allow_html=True)
+    # 리사이징 + Base64 변환 결과는 (파일, 크기, 수정시각)별로 캐시되어 rerun마다 다시 만들지 않습니다.
+    st.markdown(cursor_css(cursor_path, target_size), unsafe_allow_html=True)
 
 except FileNotFoundError:
-    st.error(f"🚨 오류: '{cursor_path}' 파일을 찾을 수 없습니다. 파일 경로를 확인해주세요.")
+    st.error(f"🚨 오류: '{IMAGE_DIR / cursor_name}' 파일을 찾을 수 없습니다. 파일 경로를 확인해주세요.")
 except Exception as e:
     st.error(f"🚨 오류 발생: {e}")
 
 
 # =============================================================================
-# 4. 앱 전체 설정
+# 3. 앱 전체 설정
 # =============================================================================
-st.markdown(
-    """
-    <!-- 구글 폰트 불러오기 -->
-    <link href="https://fonts.googleapis.com/css2?family=Noto+Sans&display=swap" rel="stylesheet">
-    <style>
-        /* 전체 앱 폰트 변경 */
-        html, body, [class*="css"] {
-            font-family: 'Noto Sans', sans-serif;
-        }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
-
-st.markdown(
-    """
-    <style>
-    /* 사이드바 실제 컨텐츠 영역 */
-    section[data-testid="stSidebar"] > div {
-        background: linear-gradient(
-            230deg,
-            #FFFFFF 0%,
-            #FFF1F2 50%,
-            #E9353E 100%
-        ) !important;
-
-        border-right: 1px solid #E5E7EB;
-    }
-
-    /* 사이드바 글자 색 */
-    section[data-testid="stSidebar"] * {
-        color: #111827;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+# 3.1 공통 스타일 (폰트 + 사이드바 + 카드, 압축된 스타일시트 하나로)
+apply_theme()
 
 # 기본 페이지 지정
 st.set_page_config(
@@ -130,7 +48,7 @@ st.set_page_config(
 
 
 # =============================================================================
-# 5. Session State 초기값 설정
+# 4. Session State 초기값 설정
 # =============================================================================
 if 'selected_industry' not in st.session_state:
     st.session_state['selected_industry'] = "음식"
@@ -139,9 +57,12 @@ if 'selected_os' not in st.session_state:
 if 'selected_month' not in st.session_state:
     st.session_state['selected_month'] = "1Q"
 
+# 4.1 모든 클러스터 데이터/모델/추천 캐시를 백그라운드로 미리 채우기 (프로세스당 한 번)
+warmup = start_warmup()
+
 
 # =============================================================================
-# 6. 페이지 정의 (st.Page)
+# 5. 페이지 정의 (st.Page)
 # =============================================================================
 home_page = st.Page(
     page="pages/home.py", 
@@ -162,18 +83,24 @@ info_page = st.Page(
     icon="📋"
 )
 
+admin_page = st.Page(
+    page="pages/admin.py",
+    title="운영 지표",
+    icon="🛠️"
+)
+
 
 # =============================================================================
-# 7. 네비게이션 구성
+# 6. 네비게이션 구성
 # =============================================================================
 pg = st.navigation({
     "메인": [home_page, viz_page],
-    "더보기": [info_page]
+    "더보기": [info_page, admin_page]
 })
 
 
 # =============================================================================
-# 8. 공통 사이드바
+# 7. 공통 사이드바
 # =============================================================================
 with st.sidebar:
     st.header("🔍 광고 옵션 선택")
@@ -195,9 +122,14 @@ with st.sidebar:
         ["1Q", "2Q", "3Q", "4Q"], 
         key='selected_month'
     )
+
+    # 워밍업이 끝나기 전에는 진행 상황 표시
+    if not warmup.ready:
+        status = warmup.snapshot()
+        st.caption(f"⏳ 데이터 준비 중 ({status['done']}/{status['total']})")
     
 
 # =============================================================================
-# 9. 실행
+# 8. 실행
 # =============================================================================
 pg.run()
\ No newline at end of file